@@ -49,8 +49,6 @@ router = APIRouter()
 _paper_search_service: Optional[PaperSearchService] = None
 _pipeline_session_store = PipelineSessionStore()
 _workflow_metric_store: Optional[WorkflowMetricStore] = None
-# Test compatibility hook: unit tests can monkeypatch this to inject a fake workflow.
-PapersCoolTopicSearchWorkflow = None
 
 _ALLOWED_REPORT_BASE = os.path.abspath("./reports")
 
@@ -42,6 +42,11 @@ class LLMService:
             except Exception:
                 self._usage_store = None
 
+    @property
+    def raise_errors(self) -> bool:
+        """Whether provider failures propagate instead of degrading to fallbacks."""
+        return self._raise_errors
+
     def complete(
         self,
         *,
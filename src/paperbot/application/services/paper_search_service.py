@@ -17,6 +17,16 @@ logger = logging.getLogger(__name__)
 
 
 _TOKEN_SEP_RX = re.compile(r"\s+")
+# Python 3.12+: run each adapter call inline until its first real suspension, so
+# cache hits and short-circuit returns never round-trip through the scheduler.
+_EAGER_TASK_FACTORY = getattr(asyncio, "eager_task_factory", None)
+
+
+def _start_task(coro) -> "asyncio.Future[Any]":
+    loop = asyncio.get_running_loop()
+    if _EAGER_TASK_FACTORY is not None:
+        return _EAGER_TASK_FACTORY(loop, coro)
+    return loop.create_task(coro)
 
 
 @dataclass
@@ -97,7 +107,7 @@ class PaperSearchService:
             except Exception as exc:
                 return exc
 
-        tasks = [_guarded_search(adapter) for adapter in selected]
+        tasks = [_start_task(_guarded_search(adapter)) for adapter in selected]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         results_by_source: Dict[str, List[PaperCandidate]] = {}
@@ -144,28 +154,10 @@ class PaperSearchService:
         unique = [paper for _, paper in fused]
         duplicates_removed = total_raw - len(unique)
 
-        # 3. Persist if requested
+        # 3. Persist if requested. Upserts are blocking DB commits, so run them on a
+        # worker thread instead of stalling every other coroutine on this loop.
         if persist and self._registry:
-            for paper in unique:
-                try:
-                    source_hint = (paper.retrieval_sources or ["unknown"])[0]
-                    upsert_kwargs = {
-                        "paper": paper.to_dict(),
-                        "source_hint": source_hint,
-                        # Interactive search path: avoid blocking user requests on best-effort
-                        # author-link syncing when SQLite is busy.
-                        "sync_authors": False,
-                    }
-                    try:
-                        result_dict = self._registry.upsert_paper(**upsert_kwargs)
-                    except TypeError as exc:
-                        if "sync_authors" not in str(exc):
-                            raise
-                        upsert_kwargs.pop("sync_authors", None)
-                        result_dict = self._registry.upsert_paper(**upsert_kwargs)
-                    paper.canonical_id = result_dict.get("id")
-                except Exception as e:
-                    logger.warning("Failed to persist paper %s: %s", paper.title[:50], e)
+            await asyncio.to_thread(self._persist_papers, unique)
 
         return SearchResult(
             papers=unique[:max_results],
@@ -174,17 +166,57 @@ class PaperSearchService:
             duplicates_removed=duplicates_removed,
         )
 
+    def _persist_papers(self, papers: List[PaperCandidate]) -> None:
+        # Prefer one transaction for the whole result set when the registry
+        # supports it; fall back to per-paper upserts if the batch fails.
+        upsert_papers = getattr(self._registry, "upsert_papers", None)
+        if upsert_papers is not None and papers:
+            try:
+                results = upsert_papers(
+                    papers=[
+                        (paper.to_dict(), (paper.retrieval_sources or ["unknown"])[0])
+                        for paper in papers
+                    ]
+                )
+            except Exception as e:
+                logger.warning("Batch persist failed, retrying per paper: %s", e)
+            else:
+                for paper, result_dict in zip(papers, results):
+                    paper.canonical_id = result_dict.get("id")
+                return
+
+        for paper in papers:
+            try:
+                source_hint = (paper.retrieval_sources or ["unknown"])[0]
+                upsert_kwargs = {
+                    "paper": paper.to_dict(),
+                    "source_hint": source_hint,
+                    # Interactive search path: avoid blocking user requests on best-effort
+                    # author-link syncing when SQLite is busy.
+                    "sync_authors": False,
+                }
+                try:
+                    result_dict = self._registry.upsert_paper(**upsert_kwargs)
+                except TypeError as exc:
+                    if "sync_authors" not in str(exc):
+                        raise
+                    upsert_kwargs.pop("sync_authors", None)
+                    result_dict = self._registry.upsert_paper(**upsert_kwargs)
+                paper.canonical_id = result_dict.get("id")
+            except Exception as e:
+                logger.warning("Failed to persist paper %s: %s", paper.title[:50], e)
+
     def _select_adapters(self, sources: Optional[List[str]]) -> List[SearchPort]:
         if sources is None:
             return list(self._adapters.values())
         return [self._adapters[s] for s in sources if s in self._adapters]
 
     async def close(self) -> None:
-        for adapter in self._adapters.values():
-            try:
-                await adapter.close()
-            except Exception:
-                pass
+        # Shut adapters down together; teardown waits on the slowest, not the sum.
+        await asyncio.gather(
+            *(adapter.close() for adapter in self._adapters.values()),
+            return_exceptions=True,
+        )
 
     @staticmethod
     def _paper_key(paper: PaperCandidate) -> str:
@@ -242,9 +274,10 @@ class PaperSearchService:
         rrf_k = max(1.0, float(rrf_k or self.DEFAULT_RRF_K))
 
         scores: Dict[str, float] = defaultdict(float)
-        provenance: Dict[str, List[str]] = defaultdict(list)
+        # Per-key source contributions; dict insertion order doubles as provenance order.
         source_contrib: Dict[str, Dict[str, float]] = defaultdict(dict)
-        best_by_key: Dict[str, PaperCandidate] = {}
+        # Best copy per key alongside its quality, so each paper is scored once.
+        best_by_key: Dict[str, Tuple[Tuple[int, int, int, int], PaperCandidate]] = {}
 
         for source, papers in results_by_source.items():
             weight = float(source_weights.get(source, 0.5))
@@ -252,16 +285,16 @@ class PaperSearchService:
                 key = self._paper_key(paper)
                 contrib = weight / (rrf_k + rank)
                 scores[key] += contrib
-                source_contrib[key][source] = source_contrib[key].get(source, 0.0) + contrib
-                if source not in provenance[key]:
-                    provenance[key].append(source)
+                contribs = source_contrib[key]
+                contribs[source] = contribs.get(source, 0.0) + contrib
 
+                quality = self._paper_quality(paper)
                 best = best_by_key.get(key)
-                if best is None or self._paper_quality(paper) > self._paper_quality(best):
-                    best_by_key[key] = paper
+                if best is None or quality > best[0]:
+                    best_by_key[key] = (quality, paper)
 
         fused: List[Tuple[float, PaperCandidate]] = []
-        for key, paper in best_by_key.items():
+        for key, (_, paper) in best_by_key.items():
             score = float(scores.get(key, 0.0))
             ranked_sources = sorted(
                 source_contrib.get(key, {}).items(), key=lambda item: (-item[1], item[0])
@@ -280,5 +313,5 @@ class PaperSearchService:
             )
         )
 
-        normalized_provenance = {k: list(v) for k, v in provenance.items()}
+        normalized_provenance = {k: list(v) for k, v in source_contrib.items()}
         return fused, normalized_provenance
@@ -68,6 +68,7 @@ class ResendEmailService:
         subject = f"[PaperBot] {report.get('title', 'DailyPaper Digest')}"
         if date_str:
             subject += f" - {date_str}"
+        unsub_prefix = self.unsub_base_url + "/api/newsletter/unsubscribe/"
 
         for email_addr in to:
             token = unsub_tokens.get(email_addr, "")
@@ -75,7 +76,7 @@ class ResendEmailService:
                 logger.warning("Resend: no unsub token for subscriber, skipping")
                 results[email_addr] = {"ok": False, "error": "missing_unsub_token"}
                 continue
-            unsub_link = f"{self.unsub_base_url}/api/newsletter/unsubscribe/{token}"
+            unsub_link = unsub_prefix + token
             html_body = self._render_html(report, markdown, unsub_link)
             text = self._render_text(report, markdown, unsub_link)
             try:
@@ -10,7 +10,7 @@ PAPER_JUDGE_SYSTEM = (
 )
 
 
-def build_paper_judge_user_prompt(*, query: str, paper: Dict[str, Any], rubric: JudgeRubric) -> str:
+def _paper_info(paper: Dict[str, Any]) -> str:
     title = paper.get("title") or ""
     abstract = paper.get("snippet") or paper.get("abstract") or ""
     authors = ", ".join(paper.get("authors") or [])
@@ -18,48 +18,87 @@ def build_paper_judge_user_prompt(*, query: str, paper: Dict[str, Any], rubric:
     keywords = ", ".join(paper.get("keywords") or [])
     upvotes = paper.get("upvotes")
 
+    return (
+        f"- Title: {title}\n"
+        f"- Abstract: {abstract}\n"
+        f"- Authors: {authors}\n"
+        f"- Venue/Subject: {venue}\n"
+        f"- Keywords: {keywords}\n"
+        + (f"- Community Upvotes (HuggingFace): {upvotes}\n" if upvotes is not None else "")
+    )
+
+
+def _rubric_text(rubric: JudgeRubric) -> str:
     rubric_blocks = []
     for idx, dim in enumerate(rubric.dimensions, start=1):
         lines = [
             f"### {idx}. {dim.label} (weight: {int(dim.weight * 100)}%)",
-            *[f"- {score}: {text}" for score, text in sorted(dim.rubric.items(), reverse=True)],
+            *[f"- {score}: {text}" for score, text in dim.sorted_rubric],
         ]
         rubric_blocks.append("\n".join(lines))
+    return "\n\n".join(rubric_blocks)
+
 
-    dims_json = ",\n    ".join(
+def _judgment_fields(rubric: JudgeRubric, *, indent: str) -> str:
+    dims_json = f",\n{indent}".join(
         [
             f'"{dim.key}": {{"score": <1-5>, "rationale": "<1-2 sentences>"}}'
             for dim in rubric.dimensions
         ]
     )
-    rubric_text = "\n\n".join(rubric_blocks)
+    return (
+        f"{indent}{dims_json},\n"
+        f'{indent}"overall": <weighted float 1.0-5.0>,\n'
+        f'{indent}"one_line_summary": "<one sentence takeaway>",\n'
+        f'{indent}"recommendation": "<must_read|worth_reading|skim|skip>",\n'
+        f'{indent}"evidence_quotes": [\n'
+        f'{indent}    {{"text": "<exact quote from abstract/paper>", "source_url": "<url if available>", "page_hint": "<section or page>"}}\n'
+        f"{indent}]\n"
+    )
 
+
+def build_paper_judge_user_prompt(*, query: str, paper: Dict[str, Any], rubric: JudgeRubric) -> str:
     return (
         "Evaluate the following paper against the research query.\n\n"
         f"## Research Query\n{query}\n\n"
         "## Paper Information\n"
-        f"- Title: {title}\n"
-        f"- Abstract: {abstract}\n"
-        f"- Authors: {authors}\n"
-        f"- Venue/Subject: {venue}\n"
-        f"- Keywords: {keywords}\n"
-        + (f"- Community Upvotes (HuggingFace): {upvotes}\n" if upvotes is not None else "")
-        + "\n"
+        f"{_paper_info(paper)}"
+        "\n"
         "Use integer scores 1-5. Abstract length should not affect scoring.\n\n"
         "## Rubric\n"
-        f"{rubric_text}\n\n"
+        f"{_rubric_text(rubric)}\n\n"
         "## Output Format (strict JSON)\n"
         "{\n"
-        f"    {dims_json},\n"
-        '    "overall": <weighted float 1.0-5.0>,\n'
-        '    "one_line_summary": "<one sentence takeaway>",\n'
-        '    "recommendation": "<must_read|worth_reading|skim|skip>",\n'
-        '    "evidence_quotes": [\n'
-        '        {"text": "<exact quote from abstract/paper>", "source_url": "<url if available>", "page_hint": "<section or page>"}\n'
-        "    ]\n"
+        f"{_judgment_fields(rubric, indent='    ')}"
         "}\n"
     )
 
 
+def build_paper_judge_batch_user_prompt(
+    *, query: str, papers: Sequence[Dict[str, Any]], rubric: JudgeRubric
+) -> str:
+    paper_blocks = "\n".join(
+        f"### Paper {idx}\n{_paper_info(paper)}" for idx, paper in enumerate(papers)
+    )
+    return (
+        "Evaluate each of the following papers independently against the research query.\n\n"
+        f"## Research Query\n{query}\n\n"
+        "## Papers\n"
+        f"{paper_blocks}"
+        "\n"
+        "Use integer scores 1-5. Abstract length should not affect scoring.\n\n"
+        "## Rubric\n"
+        f"{_rubric_text(rubric)}\n\n"
+        "## Output Format (strict JSON)\n"
+        "Return a JSON array with one object per paper, in any order:\n"
+        "[\n"
+        "    {\n"
+        '        "index": <paper number>,\n'
+        f"{_judgment_fields(rubric, indent='        ')}"
+        "    }\n"
+        "]\n"
+    )
+
+
 def dimension_keys(rubric: JudgeRubric) -> Sequence[str]:
     return [dim.key for dim in rubric.dimensions]
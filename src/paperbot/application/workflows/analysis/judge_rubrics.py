@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
 
 
 @dataclass(frozen=True)
@@ -10,6 +10,11 @@ class JudgeDimension:
     label: str
     weight: float
     rubric: Dict[int, str]
+    sorted_rubric: Tuple[Tuple[int, str], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Rubric levels are fixed once constructed; keep them highest-score first.
+        object.__setattr__(self, "sorted_rubric", tuple(sorted(self.rubric.items(), reverse=True)))
 
 
 @dataclass(frozen=True)
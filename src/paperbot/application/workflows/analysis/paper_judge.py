@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from statistics import median
-from typing import Any, Dict, List, Optional, Sequence
+from statistics import median_low
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from paperbot.application.services.llm_service import LLMService, get_llm_service
 from paperbot.application.workflows.analysis.judge_prompts import (
     PAPER_JUDGE_SYSTEM,
+    build_paper_judge_batch_user_prompt,
     build_paper_judge_user_prompt,
     dimension_keys,
 )
@@ -17,6 +19,19 @@ from paperbot.application.workflows.analysis.judge_rubrics import (
     default_judge_rubric,
 )
 
+_JSON_DECODER = json.JSONDecoder()
+_RECOMMENDATION_RANK = {"must_read": 4, "worth_reading": 3, "skim": 2, "skip": 1}
+
+
+def _clamp_score(value: Any, lo: int = 1, hi: int = 5, default: int = 3) -> int:
+    # LLMs usually emit JSON ints, so check that first and skip the try/except.
+    if type(value) is not int:
+        try:
+            value = int(value)
+        except Exception:
+            return default
+    return lo if value < lo else hi if value > hi else value
+
 
 @dataclass
 class DimensionScore:
@@ -68,22 +83,37 @@ class PaperJudge:
         self,
         llm_service: Optional[LLMService] = None,
         rubric: Optional[JudgeRubric] = None,
+        max_workers: int = 1,
     ) -> None:
         self._llm = llm_service or get_llm_service()
         self._rubric = rubric or default_judge_rubric()
-        self._dim_keys = list(dimension_keys(self._rubric))
-
-    def judge_single(self, *, paper: Dict[str, Any], query: str) -> PaperJudgment:
+        self._dim_keys = tuple(dimension_keys(self._rubric))
+        self._weight_items = tuple(
+            (key, float(weight)) for key, weight in self._rubric.weights().items()
+        )
+        self._max_workers = max(1, int(max_workers))
+        self._provider_info: Optional[Dict[str, Any]] = None
+
+    @property
+    def provider_info(self) -> Dict[str, Any]:
+        """Provider metadata for the analysis task, resolved once per judge."""
+        if self._provider_info is None:
+            self._provider_info = self._llm.describe_task_provider("analysis")
+        return self._provider_info
+
+    def judge_single(
+        self, *, paper: Dict[str, Any], query: str, use_cache: bool = True
+    ) -> PaperJudgment:
         prompt = build_paper_judge_user_prompt(query=query, paper=paper, rubric=self._rubric)
         raw = self._llm.complete(
             task_type="analysis",
             system=PAPER_JUDGE_SYSTEM,
             user=prompt,
             temperature=0.1,
+            use_cache=use_cache,
         )
         payload = self._parse_payload(raw)
-        provider_info = self._llm.describe_task_provider("analysis")
-        return self._to_judgment(payload=payload, provider_info=provider_info)
+        return self._to_judgment(payload=payload, provider_info=self.provider_info)
 
     def judge_with_calibration(
         self,
@@ -93,19 +123,52 @@ class PaperJudge:
         n_runs: int = 3,
     ) -> PaperJudgment:
         runs = max(1, int(n_runs))
-        judgments = [self.judge_single(paper=paper, query=query) for _ in range(runs)]
-        if len(judgments) == 1:
-            return judgments[0]
+        if runs == 1:
+            return self.judge_single(paper=paper, query=query)
+        return self._calibrate(self._run_concurrently(self._calibration_calls(paper, query, runs)))
+
+    def judge_batch(
+        self,
+        *,
+        papers: Sequence[Dict[str, Any]],
+        query: str,
+        n_runs: int = 1,
+    ) -> List[PaperJudgment]:
+        runs = max(1, int(n_runs))
+        if runs == 1:
+            return self._run_concurrently(
+                [lambda p=paper: self.judge_single(paper=p, query=query) for paper in papers]
+            )
+        # Flatten every paper's calibration runs into one pool, so at most
+        # ``max_workers`` LLM calls are in flight for the whole batch.
+        calls: List[Callable[[], PaperJudgment]] = []
+        for paper in papers:
+            calls.extend(self._calibration_calls(paper, query, runs))
+        judgments = self._run_concurrently(calls)
+        return [
+            self._calibrate(judgments[start : start + runs])
+            for start in range(0, len(judgments), runs)
+        ]
+
+    def _calibration_calls(
+        self, paper: Dict[str, Any], query: str, runs: int
+    ) -> List[Callable[[], PaperJudgment]]:
+        # Calibration runs share one prompt. With the response cache on, every
+        # run after the first would replay the first answer and the median
+        # would be taken over copies of one sample. Each run therefore bypasses
+        # the cache and is billed, so ``runs`` calls always mean ``runs`` samples.
+        return [lambda: self.judge_single(paper=paper, query=query, use_cache=False)] * runs
+
+    def _calibrate(self, judgments: Sequence[PaperJudgment]) -> PaperJudgment:
+        """Median-calibrate several judgments of the same paper into one."""
 
         def pick_recommendation(values: Sequence[str]) -> str:
-            rank = {"must_read": 4, "worth_reading": 3, "skim": 2, "skip": 1}
-            return sorted(values, key=lambda item: rank.get(item, 0), reverse=True)[0]
+            return max(values, key=lambda item: _RECOMMENDATION_RANK.get(item, 0))
 
         dim_medians: Dict[str, int] = {}
         for key in self._dim_keys:
-            dim_medians[key] = int(
-                median([int(getattr(j, key).score) for j in judgments])
-            )
+            # median_low always returns one of the observed integer scores.
+            dim_medians[key] = median_low(int(getattr(j, key).score) for j in judgments)
 
         payload = {
             key: {"score": score, "rationale": "Median-calibrated from multiple judge runs."}
@@ -122,60 +185,104 @@ class PaperJudge:
         }
         return self._to_judgment(payload=payload, provider_info=provider_info)
 
-    def judge_batch(
+    def judge_single_call_batch(
         self,
         *,
         papers: Sequence[Dict[str, Any]],
         query: str,
-        n_runs: int = 1,
+        batch_size: int = 5,
     ) -> List[PaperJudgment]:
+        """Score ``batch_size`` papers per LLM call instead of one call per paper.
+
+        Papers whose index is missing from the model's array response are
+        re-scored individually via :meth:`judge_single`.
+        """
+        size = max(1, int(batch_size))
+        provider_info = self.provider_info
         out: List[PaperJudgment] = []
-        for paper in papers:
-            if n_runs > 1:
-                out.append(self.judge_with_calibration(paper=paper, query=query, n_runs=n_runs))
-            else:
-                out.append(self.judge_single(paper=paper, query=query))
+        for start in range(0, len(papers), size):
+            chunk = list(papers[start : start + size])
+            prompt = build_paper_judge_batch_user_prompt(
+                query=query, papers=chunk, rubric=self._rubric
+            )
+            raw = self._llm.complete(
+                task_type="analysis",
+                system=PAPER_JUDGE_SYSTEM,
+                user=prompt,
+                temperature=0.1,
+            )
+            by_index: Dict[int, Dict[str, Any]] = {}
+            for entry in self._parse_batch_payload(raw):
+                try:
+                    idx = int(entry.get("index"))
+                except Exception:
+                    continue
+                if 0 <= idx < len(chunk):
+                    by_index.setdefault(idx, entry)
+
+            for idx, paper in enumerate(chunk):
+                payload = by_index.get(idx)
+                if payload is None:
+                    out.append(self.judge_single(paper=paper, query=query))
+                else:
+                    out.append(self._to_judgment(payload=payload, provider_info=provider_info))
         return out
 
+    def _run_concurrently(
+        self, calls: Sequence[Callable[[], PaperJudgment]]
+    ) -> List[PaperJudgment]:
+        """Run judge calls on a thread pool, returning results in submission order."""
+        if self._max_workers <= 1 or len(calls) <= 1:
+            return [call() for call in calls]
+
+        out: List[Optional[PaperJudgment]] = [None] * len(calls)
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(calls))) as executor:
+            # Submit everything before collecting so the LLM calls actually overlap.
+            future_to_idx = {executor.submit(call): idx for idx, call in enumerate(calls)}
+            for future in as_completed(future_to_idx):
+                out[future_to_idx[future]] = future.result()
+        return [judgment for judgment in out if judgment is not None]
+
     def _parse_payload(self, raw: str) -> Dict[str, Any]:
+        obj = self._parse_json(raw, dict)
+        return obj if isinstance(obj, dict) else {}
+
+    def _parse_batch_payload(self, raw: str) -> List[Dict[str, Any]]:
+        obj = self._parse_json(raw, list)
+        if not isinstance(obj, list):
+            return []
+        return [entry for entry in obj if isinstance(entry, dict)]
+
+    @staticmethod
+    def _parse_json(raw: str, expected: type) -> Any:
         text = (raw or "").strip()
         if not text:
-            return {}
+            return None
 
         # Strip <think>...</think> blocks from thinking models (MiniMax M2.1)
         text = re.sub(r"<think>[\s\S]*?</think>", "", text).strip()
         if not text:
-            return {}
-
-        try:
-            obj = json.loads(text)
-            if isinstance(obj, dict):
-                return obj
-        except Exception:
-            pass
+            return None
 
-        start = text.find("{")
-        end = text.rfind("}")
-        if start >= 0 and end > start:
+        # raw_decode tolerates prose before (via the find) and after the JSON value,
+        # so a single decode covers both clean and chatty replies.
+        opener = "[" if expected is list else "{"
+        start = 0 if text[:1] == opener else text.find(opener)
+        if start >= 0:
             try:
-                obj = json.loads(text[start : end + 1])
-                if isinstance(obj, dict):
-                    return obj
-            except Exception:
-                pass
+                obj, _ = _JSON_DECODER.raw_decode(text, start)
+            except ValueError:
+                return None
+            if isinstance(obj, expected):
+                return obj
 
-        return {}
+        return None
 
     def _to_judgment(self, *, payload: Dict[str, Any], provider_info: Dict[str, Any]) -> PaperJudgment:
         dims: Dict[str, DimensionScore] = {}
         for key in self._dim_keys:
             raw_dim = payload.get(key) if isinstance(payload.get(key), dict) else {}
-            raw_score = raw_dim.get("score", 3)
-            try:
-                score = int(raw_score)
-            except Exception:
-                score = 3
-            score = max(1, min(score, 5))
+            score = _clamp_score(raw_dim.get("score", 3))
             rationale = str(raw_dim.get("rationale") or "")
             dims[key] = DimensionScore(score=score, rationale=rationale)
 
@@ -233,11 +340,9 @@ class PaperJudge:
         return result
 
     def _weighted_overall(self, scores: Dict[str, int]) -> float:
-        weights = self._rubric.weights()
-        total = 0.0
-        for key, weight in weights.items():
-            total += float(scores.get(key, 3)) * float(weight)
-        return round(total, 4)
+        return round(
+            sum(float(scores.get(key, 3)) * weight for key, weight in self._weight_items), 4
+        )
 
     def _recommendation(self, overall: float) -> str:
         if overall >= 4.3:
@@ -1,16 +1,36 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
 
 from paperbot.application.services.llm_service import LLMService, get_llm_service
 
 
+def summary_cache_key(title: str, abstract: str) -> Tuple[str, str]:
+    return (title or "").strip().lower(), (abstract or "").strip().lower()
+
+
 class PaperSummarizer:
-    def __init__(self, llm_service: LLMService | None = None):
+    def __init__(self, llm_service: LLMService | None = None, max_cache_size: int = 2048):
         self.llm_service = llm_service or get_llm_service()
+        # LRU-bounded so a long-lived summarizer does not grow without limit.
+        self.max_cache_size = max(1, int(max_cache_size))
+        self._cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
 
     def summarize_item(self, item: Dict[str, Any]) -> str:
-        return self.llm_service.summarize_paper(
-            title=item.get("title") or "",
-            abstract=item.get("snippet") or item.get("abstract") or "",
-        )
+        title = item.get("title") or ""
+        abstract = item.get("snippet") or item.get("abstract") or ""
+        key = summary_cache_key(title, abstract)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        summary = self.llm_service.summarize_paper(title=title, abstract=abstract)
+        # An empty summary means the LLM call failed; leave it uncached so a
+        # later call can retry instead of serving the blank for good.
+        if summary:
+            self._cache[key] = summary
+            if len(self._cache) > self.max_cache_size:
+                self._cache.popitem(last=False)
+        return summary
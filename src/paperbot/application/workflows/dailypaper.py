@@ -1,19 +1,56 @@
 from __future__ import annotations
 
 import copy
+import heapq
 import json
+import logging
+import os
 import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache, partial
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence
-
-from paperbot.application.services.llm_service import LLMService, get_llm_service
+from typing import Any, Callable, DefaultDict, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional speedup for large judge pools
+    np = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib json is the fallback
+    orjson = None
+
+from paperbot.application.services.llm_service import (
+    LLMService,
+    _overlap_relevance_score,
+    get_llm_service,
+)
 from paperbot.application.workflows.analysis.paper_judge import PaperJudge
+from paperbot.application.workflows.analysis.paper_summarizer import summary_cache_key
 from paperbot.infrastructure.stores.paper_store import SqlAlchemyPaperStore
 
+logger = logging.getLogger(__name__)
 
 SUPPORTED_LLM_FEATURES = ("summary", "trends", "insight", "relevance", "digest_card")
+_SUPPORTED_LLM_FEATURES_SET = frozenset(SUPPORTED_LLM_FEATURES)
+_SUPPORTED_OUTPUT_FORMATS = frozenset({"markdown", "json"})
+_OUTPUT_FORMAT_EXPANSIONS = {
+    "markdown": ("markdown",),
+    "json": ("json",),
+    "both": ("markdown", "json"),
+}
+
+# Below this many judge candidates a plain sorted() beats building NumPy arrays.
+_NUMPY_RANK_MIN_CANDIDATES = 500
+
+# Whitespace, dashes and any other disallowed characters all collapse to one "-".
+_SLUG_SEPARATOR_RE = re.compile(r"[^a-z0-9_]+")
 
 
 def _is_publishable_figure_url(url: str) -> bool:
@@ -86,12 +123,20 @@ def build_daily_paper_report(
     search_result: Dict[str, Any],
     title: str = "DailyPaper Digest",
     top_n: int = 10,
+    now: Optional[datetime] = None,
 ) -> Dict[str, Any]:
-    now = datetime.now(timezone.utc)
+    """Shape a unified topic search result into a DailyPaper report.
+
+    Pass ``now`` to stamp several reports from one pipeline run with the same
+    ``date``/``generated_at`` (and to make output reproducible).
+    """
+    now = now or datetime.now(timezone.utc)
+    sr_get = search_result.get
+    limit = max(0, int(top_n))
     query_rows: List[Dict[str, Any]] = []
 
-    for query in search_result.get("queries") or []:
-        items = list(query.get("items") or [])[: max(0, int(top_n))]
+    for query in sr_get("queries") or []:
+        items = list(query.get("items") or [])[:limit]
         query_rows.append(
             {
                 "raw_query": query.get("raw_query") or query.get("normalized_query") or "",
@@ -101,15 +146,15 @@ def build_daily_paper_report(
             }
         )
 
-    global_top = list(search_result.get("items") or [])[: max(0, int(top_n))]
-    summary = search_result.get("summary") or {}
+    global_top = list(sr_get("items") or [])[:limit]
+    summary = sr_get("summary") or {}
 
     return {
         "title": title,
         "date": now.date().isoformat(),
         "generated_at": now.isoformat(),
-        "source": search_result.get("source") or "papers.cool",
-        "sources": search_result.get("sources") or ["papers_cool"],
+        "source": sr_get("source") or "papers.cool",
+        "sources": sr_get("sources") or ["papers_cool"],
         "stats": {
             "unique_items": int(summary.get("unique_items") or 0),
             "total_query_hits": int(summary.get("total_query_hits") or 0),
@@ -181,21 +226,124 @@ def persist_judge_scores_to_registry(
     return store.upsert_judge_scores_from_report(report)
 
 
+def _clone_report_spine(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy the report containers and query item dicts; share leaf values.
+
+    Later stages only set keys on the report, its queries and their
+    ``top_items`` dicts, so cloning that spine isolates callers without
+    paying for a deep copy of every nested string and list.
+    """
+    copied = dict(report)
+    if "queries" in report:
+        queries: List[Dict[str, Any]] = []
+        for query in report.get("queries") or []:
+            query_copy = dict(query)
+            if "top_items" in query:
+                query_copy["top_items"] = [dict(item) for item in query.get("top_items") or []]
+            queries.append(query_copy)
+        copied["queries"] = queries
+    if "global_top" in report:
+        copied["global_top"] = list(report.get("global_top") or [])
+    if "stats" in report:
+        copied["stats"] = dict(report.get("stats") or {})
+    return copied
+
+
+# (call, store, fallback): ``fallback()`` is stored instead when ``call`` raises.
+_LLMTask = Tuple[Callable[[], Any], Callable[[Any], None], Callable[[], Any]]
+
+
+def _digest_card_fallback() -> Dict[str, Any]:
+    return {"highlight": "", "method": "", "finding": "", "tags": []}
+
+
+def _relevance_fallback(paper: Dict[str, Any], query: str) -> Dict[str, Any]:
+    # Same token-overlap heuristic LLMService.assess_relevance falls back to.
+    return {
+        "score": _overlap_relevance_score(query=query, paper=paper),
+        "reason": "Fallback score from token overlap (LLM output unavailable).",
+    }
+
+
+def _call_or_fallback(
+    call: Callable[[], Any], fallback: Callable[[], Any], raise_errors: bool
+) -> Any:
+    try:
+        return call()
+    except Exception as exc:
+        if raise_errors:
+            raise
+        logger.warning("DailyPaper LLM enrichment call failed: %s", exc)
+        return fallback()
+
+
+def _run_llm_tasks(
+    tasks: Sequence[_LLMTask], *, max_workers: int, raise_errors: bool = False
+) -> None:
+    """Run enrichment tasks concurrently; ``store`` runs on the caller thread.
+
+    A failing call stores its fallback instead of aborting the whole report,
+    unless ``raise_errors`` is set, in which case the first failure propagates.
+    """
+    if max_workers <= 1 or len(tasks) <= 1:
+        for call, store, fallback in tasks:
+            store(_call_or_fallback(call, fallback, raise_errors))
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        future_to_store = {
+            executor.submit(_call_or_fallback, call, fallback, raise_errors): store
+            for call, store, fallback in tasks
+        }
+        for future in as_completed(future_to_store):
+            future_to_store[future](future.result())
+
+
+def _assign_to_items(items: List[Dict[str, Any]], field: str, value: Any) -> None:
+    # Deep-copy per item so shared results (and their nested lists, e.g. card
+    # tags) are not aliased across items.
+    for item in items:
+        item[field] = copy.deepcopy(value)
+
+
 def enrich_daily_paper_report(
     report: Dict[str, Any],
     *,
     llm_service: Optional[LLMService] = None,
     llm_features: Sequence[str] = ("summary",),
     max_items_per_query: int = 3,
+    max_workers: int = 8,
 ) -> Dict[str, Any]:
-    """Optionally enrich DailyPaper report with LLM outputs."""
+    """Optionally enrich DailyPaper report with LLM outputs.
 
+    Per-item and per-query LLM calls are independent, so they are issued
+    concurrently on up to ``max_workers`` threads.
+    """
+
+    enriched = _clone_report_spine(report)
+    _enrich_report_in_place(
+        enriched,
+        llm_service=llm_service,
+        llm_features=llm_features,
+        max_items_per_query=max_items_per_query,
+        max_workers=max_workers,
+    )
+    return enriched
+
+
+def _enrich_report_in_place(
+    enriched: Dict[str, Any],
+    *,
+    llm_service: Optional[LLMService],
+    llm_features: Sequence[str],
+    max_items_per_query: int,
+    max_workers: int,
+) -> None:
     features = normalize_llm_features(llm_features)
     if not features:
-        return copy.deepcopy(report)
+        return
 
     svc = llm_service or get_llm_service()
-    enriched = copy.deepcopy(report)
     llm_block: Dict[str, Any] = {
         "enabled": True,
         "features": features,
@@ -203,54 +351,127 @@ def enrich_daily_paper_report(
         "daily_insight": "",
     }
 
+    tasks: List[_LLMTask] = []
+    # The same paper often tops several queries. Summaries and digest cards only
+    # read title/abstract, so each unique paper gets one call fanned out to all.
+    summary_targets: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+    card_targets: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
     for query in enriched.get("queries") or []:
         query_name = query.get("normalized_query") or query.get("raw_query") or ""
         top_items = (query.get("top_items") or [])[: max(1, int(max_items_per_query))]
 
-        if "summary" in features:
-            for item in top_items:
-                item["ai_summary"] = svc.summarize_paper(
-                    title=item.get("title") or "",
-                    abstract=item.get("snippet") or item.get("abstract") or "",
+        for item in top_items:
+            title = item.get("title") or ""
+            abstract = item.get("snippet") or item.get("abstract") or ""
+            key = summary_cache_key(title, abstract)
+            if "summary" in features:
+                targets = summary_targets.get(key)
+                if targets is None:
+                    targets = summary_targets[key] = []
+                    tasks.append(
+                        (
+                            partial(svc.summarize_paper, title=title, abstract=abstract),
+                            partial(_assign_to_items, targets, "ai_summary"),
+                            str,
+                        )
+                    )
+                targets.append(item)
+            if "digest_card" in features:
+                targets = card_targets.get(key)
+                if targets is None:
+                    targets = card_targets[key] = []
+                    tasks.append(
+                        (
+                            partial(svc.extract_daily_digest_card, title=title, abstract=abstract),
+                            partial(_assign_to_items, targets, "digest_card"),
+                            _digest_card_fallback,
+                        )
+                    )
+                targets.append(item)
+            if "relevance" in features:
+                paper = dict(item)
+                tasks.append(
+                    (
+                        partial(svc.assess_relevance, paper=paper, query=query_name),
+                        partial(item.__setitem__, "relevance"),
+                        partial(_relevance_fallback, paper, query_name),
+                    )
                 )
 
-        if "digest_card" in features:
-            for item in top_items:
-                item["digest_card"] = svc.extract_daily_digest_card(
-                    title=item.get("title") or "",
-                    abstract=item.get("snippet") or item.get("abstract") or "",
-                )
-
-        if "relevance" in features:
-            for item in top_items:
-                item["relevance"] = svc.assess_relevance(paper=item, query=query_name)
-
         if "trends" in features and top_items:
-            trend_text = svc.analyze_trends(topic=query_name, papers=top_items)
-            llm_block["query_trends"].append({"query": query_name, "analysis": trend_text})
+            trend: Dict[str, Any] = {"query": query_name, "analysis": ""}
+            llm_block["query_trends"].append(trend)
+            tasks.append(
+                (
+                    partial(svc.analyze_trends, topic=query_name, papers=list(top_items)),
+                    partial(trend.__setitem__, "analysis"),
+                    str,
+                )
+            )
 
     if "insight" in features:
-        llm_block["daily_insight"] = svc.generate_daily_insight(enriched)
+        # The insight prompt only reads titles and hit counts, not enrichment output.
+        tasks.append(
+            (
+                partial(svc.generate_daily_insight, enriched),
+                partial(llm_block.__setitem__, "daily_insight"),
+                str,
+            )
+        )
+
+    _run_llm_tasks(
+        tasks,
+        max_workers=max(1, int(max_workers)),
+        raise_errors=bool(getattr(svc, "raise_errors", False)),
+    )
 
     enriched["llm_analysis"] = llm_block
-    return enriched
 
 
 def estimate_judge_tokens_for_item(item: Dict[str, Any], *, n_runs: int = 1) -> int:
     """Estimate judge token usage to support lightweight budget controls."""
 
-    title = item.get("title") or ""
-    abstract = item.get("snippet") or item.get("abstract") or ""
-    keywords = ", ".join(item.get("keywords") or [])
+    return _estimate_judge_tokens(
+        item.get("title") or "",
+        item.get("snippet") or item.get("abstract") or "",
+        tuple(item.get("keywords") or ()),
+        max(1, int(n_runs)),
+    )
+
 
-    content_chars = len(f"{title}\n{abstract}\n{keywords}")
+@lru_cache(maxsize=4096)
+def _estimate_judge_tokens(title: str, abstract: str, keywords: Tuple[str, ...], runs: int) -> int:
+    content_chars = len(f"{title}\n{abstract}\n{', '.join(keywords)}")
     content_tokens = max(120, content_chars // 4)
 
     # Prompt/rubric text is relatively long; keep a conservative fixed overhead.
     base_prompt_tokens = 650
     expected_output_tokens = 280
     per_run = base_prompt_tokens + content_tokens + expected_output_tokens
-    return per_run * max(1, int(n_runs))
+    return per_run * runs
+
+
+def _rank_judge_candidates(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Order candidates by ``base_score`` descending, keeping input order for ties."""
+    if np is not None and len(candidates) >= _NUMPY_RANK_MIN_CANDIDATES:
+        scores = np.fromiter(
+            (row["base_score"] for row in candidates), dtype=np.float64, count=len(candidates)
+        )
+        order = np.argsort(-scores, kind="stable")
+        return [candidates[idx] for idx in order.tolist()]
+    return sorted(candidates, key=lambda row: row["base_score"], reverse=True)
+
+
+def _iter_ranked_judge_candidates(candidates: List[Dict[str, Any]]) -> Iterable[Dict[str, Any]]:
+    """Lazily yield candidates in ``_rank_judge_candidates`` order via a heap.
+
+    Heapify is O(N) and each pop O(log N), so a budgeted selection that stops
+    after k picks avoids sorting the whole pool.
+    """
+    heap = [(-row["base_score"], idx, row) for idx, row in enumerate(candidates)]
+    heapq.heapify(heap)
+    while heap:
+        yield heapq.heappop(heap)[2]
 
 
 def select_judge_candidates(
@@ -284,26 +505,27 @@ def select_judge_candidates(
                 }
             )
 
-    ranked = sorted(candidates, key=lambda row: row["base_score"], reverse=True)
-
-    selected: List[Dict[str, Any]] = []
-    consumed = 0
-    for row in ranked:
-        if budget > 0 and consumed + int(row["estimated_tokens"]) > budget:
-            continue
-        consumed += int(row["estimated_tokens"])
-        selected.append(row)
-
-    if budget <= 0:
-        selected = ranked
-        consumed = sum(int(row["estimated_tokens"]) for row in selected)
-
-    selected_by_query: Dict[int, List[int]] = {}
+    if budget > 0:
+        selected: List[Dict[str, Any]] = []
+        consumed = 0
+        min_tokens = min((row["estimated_tokens"] for row in candidates), default=0)
+        for row in _iter_ranked_judge_candidates(candidates):
+            if budget - consumed < min_tokens:
+                break  # nothing left in the pool can fit
+            tokens = row["estimated_tokens"]
+            if consumed + tokens > budget:
+                continue
+            consumed += tokens
+            selected.append(row)
+    else:
+        selected = _rank_judge_candidates(candidates)
+        consumed = sum(row["estimated_tokens"] for row in selected)
+
+    # (query_index, item_index) pairs are unique by construction; no set needed.
+    indices_by_query: DefaultDict[int, List[int]] = defaultdict(list)
     for row in selected:
-        selected_by_query.setdefault(int(row["query_index"]), []).append(int(row["item_index"]))
-
-    for key in list(selected_by_query.keys()):
-        selected_by_query[key] = sorted(set(selected_by_query[key]))
+        indices_by_query[row["query_index"]].append(row["item_index"])
+    selected_by_query = {key: sorted(indices) for key, indices in indices_by_query.items()}
 
     return {
         "selected": selected,
@@ -325,12 +547,37 @@ def apply_judge_scores_to_report(
     max_items_per_query: int = 5,
     n_runs: int = 1,
     judge_token_budget: int = 0,
+    max_workers: int = 4,
 ) -> Dict[str, Any]:
-    """Evaluate papers with LLM-as-Judge and attach per-paper judgment metadata."""
+    """Evaluate papers with LLM-as-Judge and attach per-paper judgment metadata.
+
+    Per-query judge batches run concurrently on up to ``max_workers`` threads.
+    """
 
-    judged = copy.deepcopy(report)
+    judged = _clone_report_spine(report)
+    _judge_report_in_place(
+        judged,
+        llm_service=llm_service,
+        max_items_per_query=max_items_per_query,
+        n_runs=n_runs,
+        judge_token_budget=judge_token_budget,
+        max_workers=max_workers,
+    )
+    return judged
+
+
+def _judge_report_in_place(
+    judged: Dict[str, Any],
+    *,
+    llm_service: Optional[LLMService],
+    max_items_per_query: int,
+    n_runs: int,
+    judge_token_budget: int,
+    max_workers: int,
+) -> None:
+    runs = max(1, int(n_runs))
+    cap = max(1, int(max_items_per_query))
     svc = llm_service or get_llm_service()
-    judge = PaperJudge(llm_service=svc)
 
     recommendation_count = {
         "must_read": 0,
@@ -347,6 +594,8 @@ def apply_judge_scores_to_report(
     )
     selected_by_query = selection["selected_by_query"]
 
+    # (query, top_items, chosen_indices, chosen_items, query_name) per judged query.
+    batches: List[Tuple[Any, ...]] = []
     for query_index, query in enumerate(judged.get("queries") or []):
         query_name = query.get("normalized_query") or query.get("raw_query") or ""
         top_items = list(query.get("top_items") or [])
@@ -357,10 +606,26 @@ def apply_judge_scores_to_report(
         chosen_items = [top_items[idx] for idx in chosen_indices if 0 <= idx < len(top_items)]
         if not chosen_items:
             continue
-
-        judgments = judge.judge_batch(
-            papers=chosen_items, query=query_name, n_runs=max(1, int(n_runs))
-        )
+        batches.append((query, top_items, chosen_indices, chosen_items, query_name))
+
+    # Split the worker budget between the per-query pool and each judge's own
+    # pool, so at most ``max_workers`` LLM calls are in flight in total.
+    workers = max(1, int(max_workers))
+    query_workers = max(1, min(workers, len(batches)))
+    judge = PaperJudge(llm_service=svc, max_workers=workers // query_workers)
+
+    def run_batch(batch: Tuple[Any, ...]) -> List[Any]:
+        _, _, _, chosen_items, query_name = batch
+        return judge.judge_batch(papers=chosen_items, query=query_name, n_runs=runs)
+
+    # Each query's batch is an independent network-bound call; overlap them.
+    if query_workers > 1:
+        with ThreadPoolExecutor(max_workers=query_workers) as executor:
+            batch_judgments = list(executor.map(run_batch, batches))
+    else:
+        batch_judgments = [run_batch(batch) for batch in batches]
+
+    for (query, top_items, chosen_indices, _, _), judgments in zip(batches, batch_judgments):
         for item_index, judgment in zip(chosen_indices, judgments):
             item = top_items[item_index]
             j_payload = judgment.to_dict()
@@ -369,139 +634,204 @@ def apply_judge_scores_to_report(
             if rec in recommendation_count:
                 recommendation_count[rec] += 1
 
-        capped_count = min(len(top_items), max(1, int(max_items_per_query)))
-        capped = top_items[:capped_count]
-        capped.sort(
-            key=lambda it: float((it.get("judge") or {}).get("overall") or -1), reverse=True
-        )
-        query["top_items"] = capped + top_items[capped_count:]
+        capped_count = min(len(top_items), cap)
+        # Decorate once, sort on the C-level itemgetter, then strip.
+        decorated = [
+            (float((it.get("judge") or {}).get("overall") or -1), it)
+            for it in top_items[:capped_count]
+        ]
+        decorated.sort(key=itemgetter(0), reverse=True)
+        query["top_items"] = [it for _, it in decorated] + top_items[capped_count:]
 
     judged["judge"] = {
         "enabled": True,
         "max_items_per_query": int(max_items_per_query),
-        "n_runs": int(max(1, int(n_runs))),
+        "n_runs": runs,
         "recommendation_count": recommendation_count,
         "budget": selection["budget"],
     }
-    return judged
+
+
+def compose_daily_report(
+    *,
+    search_result: Dict[str, Any],
+    title: str = "DailyPaper Digest",
+    top_n: int = 10,
+    llm_service: Optional[LLMService] = None,
+    llm_features: Sequence[str] = (),
+    llm_max_items_per_query: int = 3,
+    llm_max_workers: int = 8,
+    enable_judge: bool = False,
+    judge_max_items_per_query: int = 5,
+    judge_runs: int = 1,
+    judge_token_budget: int = 0,
+    judge_max_workers: int = 4,
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """Build, enrich and judge a DailyPaper report in one go.
+
+    Equivalent to chaining ``build_daily_paper_report``,
+    ``enrich_daily_paper_report`` and ``apply_judge_scores_to_report``, but the
+    item dicts are copied away from ``search_result`` once and every later
+    stage writes into that single copy. The ``llm_*`` and ``judge_*`` knobs
+    are passed to the enrichment and judge stages under their own names.
+    """
+
+    report = _clone_report_spine(
+        build_daily_paper_report(search_result=search_result, title=title, top_n=top_n, now=now)
+    )
+    if llm_features:
+        _enrich_report_in_place(
+            report,
+            llm_service=llm_service,
+            llm_features=llm_features,
+            max_items_per_query=llm_max_items_per_query,
+            max_workers=llm_max_workers,
+        )
+    if enable_judge:
+        _judge_report_in_place(
+            report,
+            llm_service=llm_service,
+            max_items_per_query=judge_max_items_per_query,
+            n_runs=judge_runs,
+            judge_token_budget=judge_token_budget,
+            max_workers=judge_max_workers,
+        )
+    return report
+
+
+_ITEM_LINE_URL_FMT = "%s[%s](%s) | score=%s%s"
+_ITEM_LINE_NO_URL_FMT = "%s%s | score=%s%s"
+
+
+def _item_row(item: Dict[str, Any]) -> Tuple[str, str, Any]:
+    get = item.get
+    return get("title") or "Untitled", get("url") or get("external_url") or "", get("score")
+
+
+def _format_item_line(prefix: str, row: Tuple[str, str, Any], suffix: str = "") -> str:
+    title, url, score = row
+    if url:
+        return _ITEM_LINE_URL_FMT % (prefix, title, url, score, suffix)
+    return _ITEM_LINE_NO_URL_FMT % (prefix, title, score, suffix)
+
+
+# Item keys that produce detail lines under an item; plain search hits have none.
+_ITEM_DETAIL_KEYS = frozenset({"ai_summary", "relevance", "judge", "digest_card"})
+
+
+def _render_item_details(add: Callable[[str], None], item: Dict[str, Any]) -> None:
+    ai_summary = (item.get("ai_summary") or "").strip()
+    if ai_summary:
+        add(f"  - AI Summary: {ai_summary}")
+
+    relevance = item.get("relevance")
+    if isinstance(relevance, dict):
+        rel_score = relevance.get("score")
+        rel_reason = relevance.get("reason") or ""
+        add(f"  - Relevance: score={rel_score} reason={rel_reason}")
+
+    judge = item.get("judge")
+    if isinstance(judge, dict):
+        overall = judge.get("overall")
+        rec = judge.get("recommendation")
+        add(f"  - Judge: overall={overall} recommendation={rec}")
+        one_line = judge.get("one_line_summary") or ""
+        if one_line:
+            add(f"  - Judge Summary: {one_line}")
+
+    digest_card = item.get("digest_card")
+    if isinstance(digest_card, dict):
+        highlight = digest_card.get("highlight") or ""
+        if highlight:
+            add(f"  - Highlight: {highlight}")
+        method = digest_card.get("method") or ""
+        if method:
+            add(f"  - Method: {method}")
+        finding = digest_card.get("finding") or ""
+        if finding:
+            add(f"  - Finding: {finding}")
+        tags = digest_card.get("tags") or []
+        if tags:
+            add(f"  - Tags: {', '.join(tags)}")
 
 
 def render_daily_paper_markdown(report: Dict[str, Any]) -> str:
-    lines: List[str] = []
-    lines.append(f"# {report.get('title') or 'DailyPaper Digest'}")
-    lines.append("")
-    lines.append(f"- Date: {report.get('date')}")
-    lines.append(f"- Generated At (UTC): {report.get('generated_at')}")
-    lines.append(f"- Source: {report.get('source')}")
-    lines.append(f"- Sources: {', '.join(report.get('sources') or [])}")
     stats = report.get("stats") or {}
-    lines.append(f"- Unique Items: {stats.get('unique_items', 0)}")
-    lines.append(f"- Total Query Hits: {stats.get('total_query_hits', 0)}")
-    lines.append("")
-
-    lines.append("## Query Highlights")
-    lines.append("")
-    for query in report.get("queries") or []:
+    lines: List[str] = [
+        f"# {report.get('title') or 'DailyPaper Digest'}",
+        "",
+        f"- Date: {report.get('date')}",
+        f"- Generated At (UTC): {report.get('generated_at')}",
+        f"- Source: {report.get('source')}",
+        f"- Sources: {', '.join(report.get('sources') or [])}",
+        f"- Unique Items: {stats.get('unique_items', 0)}",
+        f"- Total Query Hits: {stats.get('total_query_hits', 0)}",
+        "",
+        "## Query Highlights",
+        "",
+    ]
+    # Bound once; this is called for every rendered line.
+    add = lines.append
+    queries = report.get("queries") or []
+    for query in queries:
         normalized = query.get("normalized_query") or ""
-        total_hits = query.get("total_hits") or 0
-        lines.append(f"### {normalized} ({total_hits} hits)")
+        add("### %s (%s hits)" % (normalized, query.get("total_hits") or 0))
         top_items = query.get("top_items") or []
         if not top_items:
-            lines.append("- No hits")
-            lines.append("")
+            add("- No hits")
+            add("")
             continue
-        for item in top_items[:5]:
-            title = item.get("title") or "Untitled"
-            url = item.get("url") or item.get("external_url") or ""
-            score = item.get("score")
-            if url:
-                lines.append(f"- [{title}]({url}) | score={score}")
-            else:
-                lines.append(f"- {title} | score={score}")
-
-            ai_summary = (item.get("ai_summary") or "").strip()
-            if ai_summary:
-                lines.append(f"  - AI Summary: {ai_summary}")
-
-            relevance = item.get("relevance")
-            if isinstance(relevance, dict):
-                rel_score = relevance.get("score")
-                rel_reason = relevance.get("reason") or ""
-                lines.append(f"  - Relevance: score={rel_score} reason={rel_reason}")
-
-            judge = item.get("judge")
-            if isinstance(judge, dict):
-                overall = judge.get("overall")
-                rec = judge.get("recommendation")
-                lines.append(f"  - Judge: overall={overall} recommendation={rec}")
-                one_line = judge.get("one_line_summary") or ""
-                if one_line:
-                    lines.append(f"  - Judge Summary: {one_line}")
-
-            digest_card = item.get("digest_card")
-            if isinstance(digest_card, dict):
-                highlight = digest_card.get("highlight") or ""
-                if highlight:
-                    lines.append(f"  - Highlight: {highlight}")
-                method = digest_card.get("method") or ""
-                if method:
-                    lines.append(f"  - Method: {method}")
-                finding = digest_card.get("finding") or ""
-                if finding:
-                    lines.append(f"  - Finding: {finding}")
-                tags = digest_card.get("tags") or []
-                if tags:
-                    lines.append(f"  - Tags: {', '.join(tags)}")
-        lines.append("")
-
-    lines.append("## Global Top")
-    lines.append("")
-    for idx, item in enumerate(report.get("global_top") or [], start=1):
-        title = item.get("title") or "Untitled"
-        url = item.get("url") or item.get("external_url") or ""
-        score = item.get("score")
+        shown = top_items[:5]
+        for item, row in zip(shown, map(_item_row, shown)):
+            add(_format_item_line("- ", row))
+            if not _ITEM_DETAIL_KEYS.isdisjoint(item):
+                _render_item_details(add, item)
+        add("")
+
+    add("## Global Top")
+    add("")
+    global_top = report.get("global_top") or []
+    for idx, (item, row) in enumerate(zip(global_top, map(_item_row, global_top)), start=1):
         matched_queries = ", ".join(item.get("matched_queries") or [])
-        if url:
-            lines.append(f"{idx}. [{title}]({url}) | score={score} | queries={matched_queries}")
-        else:
-            lines.append(f"{idx}. {title} | score={score} | queries={matched_queries}")
+        add(_format_item_line(f"{idx}. ", row, f" | queries={matched_queries}"))
 
-    if not (report.get("global_top") or []):
-        lines.append("- No items")
+    if not global_top:
+        add("- No items")
 
     llm_analysis = report.get("llm_analysis") or {}
     if llm_analysis:
-        lines.append("")
-        lines.append("## LLM Insights")
-        lines.append("")
+        add("")
+        add("## LLM Insights")
+        add("")
 
         features = ", ".join(llm_analysis.get("features") or [])
         if features:
-            lines.append(f"- Enabled Features: {features}")
+            add(f"- Enabled Features: {features}")
 
         daily_insight = (llm_analysis.get("daily_insight") or "").strip()
         if daily_insight:
-            lines.append(f"- Daily Insight: {daily_insight}")
+            add(f"- Daily Insight: {daily_insight}")
 
         trends = llm_analysis.get("query_trends") or []
         if trends:
-            lines.append("")
-            lines.append("### Query Trends")
+            add("")
+            add("### Query Trends")
             for trend in trends:
                 topic = trend.get("query") or ""
                 text = trend.get("analysis") or ""
-                lines.append(f"- {topic}: {text}")
+                add(f"- {topic}: {text}")
 
     judge_block = report.get("judge") or {}
     if judge_block:
-        lines.append("")
-        lines.append("## Judge Summary")
-        lines.append("")
+        add("")
+        add("## Judge Summary")
+        add("")
         recommendation_count = judge_block.get("recommendation_count") or {}
         for key in ("must_read", "worth_reading", "skim", "skip"):
-            lines.append(f"- {key}: {recommendation_count.get(key, 0)}")
+            add(f"- {key}: {recommendation_count.get(key, 0)}")
 
-    lines.append("")
+    add("")
     return "\n".join(lines)
 
 
@@ -524,67 +854,157 @@ class DailyPaperReporter:
         markdown: str,
         formats: Sequence[str] = ("markdown", "json"),
         slug: Optional[str] = None,
+        now: Optional[datetime] = None,
     ) -> DailyPaperArtifacts:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        artifacts, writes = self._plan_write(
+            report=report, markdown=markdown, formats=formats, slug=slug, now=now
+        )
+        # Overlap JSON encoding with the markdown write.
+        _run_file_writes(writes, max_workers=len(writes))
+        return artifacts
+
+    def write_many(
+        self,
+        items: Sequence[Tuple[Dict[str, Any], str, Sequence[str], Optional[str]]],
+        now: Optional[datetime] = None,
+    ) -> List[DailyPaperArtifacts]:
+        """Write several reports at once, e.g. for backfills or bulk re-renders.
+
+        Each item is ``(report, markdown, formats, slug)``. The output directory
+        is created once and all files are written from a shared worker pool.
+        """
+        if not items:
+            return []
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        now = now or datetime.now(timezone.utc)
+        results: List[DailyPaperArtifacts] = []
+        writes: List[Callable[[], Any]] = []
+        for report, markdown, formats, slug in items:
+            artifacts, item_writes = self._plan_write(
+                report=report, markdown=markdown, formats=formats, slug=slug, now=now
+            )
+            results.append(artifacts)
+            writes.extend(item_writes)
+
+        _run_file_writes(writes, max_workers=min(len(writes), os.cpu_count() or 1))
+        return results
+
+    def _plan_write(
+        self,
+        *,
+        report: Dict[str, Any],
+        markdown: str,
+        formats: Sequence[str],
+        slug: Optional[str],
+        now: Optional[datetime],
+    ) -> Tuple[DailyPaperArtifacts, List[Callable[[], Any]]]:
         formats_set = {fmt.lower().strip() for fmt in formats if fmt.strip()}
         if not formats_set:
             formats_set = {"markdown", "json"}
 
-        day = report.get("date") or datetime.now(timezone.utc).date().isoformat()
+        day = report.get("date") or (now or datetime.now(timezone.utc)).date().isoformat()
         safe_slug = _safe_slug(slug or report.get("title") or "dailypaper")
         stem = f"{day}-{safe_slug}"
 
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-
         md_path: Optional[Path] = None
         json_path: Optional[Path] = None
+        writes: List[Callable[[], Any]] = []
 
         if "markdown" in formats_set:
             md_path = self.output_dir / f"{stem}.md"
-            md_path.write_text(markdown, encoding="utf-8")
+            writes.append(partial(_write_atomically, md_path, _write_markdown, markdown))
 
         if "json" in formats_set:
             json_path = self.output_dir / f"{stem}.json"
-            json_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+            writes.append(partial(_write_atomically, json_path, _write_report_json, report))
 
-        return DailyPaperArtifacts(
+        artifacts = DailyPaperArtifacts(
             report=report,
             markdown=markdown,
             markdown_path=str(md_path) if md_path else None,
             json_path=str(json_path) if json_path else None,
         )
+        return artifacts, writes
+
+
+def _run_file_writes(writes: Sequence[Callable[[], Any]], *, max_workers: int) -> None:
+    if max_workers <= 1 or len(writes) <= 1:
+        for write in writes:
+            write()
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for future in [executor.submit(write) for write in writes]:
+            future.result()
+
+
+def _write_atomically(path: Path, write: Callable[[Path, Any], None], payload: Any) -> None:
+    """Write into a sibling temp file, then ``os.replace`` it over ``path``.
+
+    Readers (and concurrent pipelines sharing ``output_dir``) never observe a
+    truncated artifact; an interrupted write leaves the previous file intact.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        write(tmp, payload)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _write_markdown(path: Path, markdown: str) -> None:
+    path.write_text(markdown, encoding="utf-8")
+
+
+def _write_report_json(path: Path, report: Dict[str, Any]) -> None:
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson rejects some values stdlib json accepts (e.g. >64-bit ints).
+            payload = None
+        if payload is not None:
+            path.write_bytes(payload)
+            return
+
+    # Stream through a large buffer instead of materializing the whole document.
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as fh:
+        json.dump(report, fh, ensure_ascii=False, indent=2)
 
 
 def _safe_slug(text: str) -> str:
-    lowered = (text or "").strip().lower()
-    lowered = re.sub(r"\s+", "-", lowered)
-    lowered = re.sub(r"[^a-z0-9\-_]+", "-", lowered)
-    lowered = re.sub(r"-+", "-", lowered).strip("-")
-    return lowered or "daily"
+    slug = _SLUG_SEPARATOR_RE.sub("-", (text or "").strip().lower()).strip("-")
+    return slug or "daily"
+
+
+def _is_clean_selection(values: Iterable[str], allowed: frozenset) -> bool:
+    """True for a list/tuple of distinct, already-normalized allowed values."""
+    return (
+        isinstance(values, (list, tuple))
+        and all(isinstance(value, str) and value in allowed for value in values)
+        and len(set(values)) == len(values)
+    )
 
 
 def normalize_output_formats(formats: Iterable[str]) -> List[str]:
-    normalized: List[str] = []
-    seen = set()
-    for fmt in formats:
-        key = (fmt or "").strip().lower()
-        if key == "both":
-            for item in ("markdown", "json"):
-                if item not in seen:
-                    seen.add(item)
-                    normalized.append(item)
-            continue
-        if key in {"markdown", "json"} and key not in seen:
-            seen.add(key)
-            normalized.append(key)
-    return normalized or ["markdown", "json"]
+    if formats and _is_clean_selection(formats, _SUPPORTED_OUTPUT_FORMATS):
+        return list(formats)
+
+    # dict.fromkeys dedupes in C while keeping first-seen order.
+    normalized = dict.fromkeys(
+        expanded
+        for fmt in formats
+        for expanded in _OUTPUT_FORMAT_EXPANSIONS.get((fmt or "").strip().lower(), ())
+    )
+    return list(normalized) or ["markdown", "json"]
 
 
 def normalize_llm_features(features: Iterable[str]) -> List[str]:
-    normalized: List[str] = []
-    seen = set()
-    for feature in features:
-        key = (feature or "").strip().lower()
-        if key in SUPPORTED_LLM_FEATURES and key not in seen:
-            seen.add(key)
-            normalized.append(key)
-    return normalized
+    if _is_clean_selection(features, _SUPPORTED_LLM_FEATURES_SET):
+        return list(features)
+
+    keys = ((feature or "").strip().lower() for feature in features)
+    return list(dict.fromkeys(key for key in keys if key in _SUPPORTED_LLM_FEATURES_SET))
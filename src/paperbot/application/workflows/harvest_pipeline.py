@@ -9,10 +9,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import uuid
-from dataclasses import dataclass, field
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from itertools import chain
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Tuple
 
 from paperbot.domain.harvest import (
     HarvestSource,
@@ -27,6 +30,9 @@ from paperbot.infrastructure.stores.paper_store import PaperStore
 
 logger = logging.getLogger(__name__)
 
+_ALL_SOURCE_VALUES: Tuple[str, ...] = tuple(s.value for s in HarvestSource)
+_VALID_SOURCES = frozenset(_ALL_SOURCE_VALUES)
+
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
@@ -96,6 +102,11 @@ class HarvestPipeline:
         self._paper_store: Optional[PaperStore] = None
         self._search_service = search_service
 
+        # Expansion/recommendation are pure functions of their inputs; reuse them
+        # across runs on the same pipeline (scheduled jobs, retries).
+        self._expansion_cache: Dict[Tuple[str, ...], List[str]] = {}
+        self._venue_cache: Dict[Tuple[Tuple[str, ...], int], List[str]] = {}
+
     @property
     def query_rewriter(self) -> QueryRewriter:
         if self._query_rewriter is None:
@@ -122,12 +133,34 @@ class HarvestPipeline:
             self._search_service = make_default_search_service(registry=self.paper_store)
         return self._search_service
 
+    def _ensure_services(self) -> Tuple[PaperStore, PaperSearchService]:
+        """Resolve the services every run needs once, instead of per use."""
+        return self.paper_store, self.search_service
+
+    def _expand_keywords(self, keywords: List[str]) -> List[str]:
+        key = tuple(keywords)
+        expanded = self._expansion_cache.get(key)
+        if expanded is None:
+            expanded = self._expansion_cache[key] = self.query_rewriter.expand_all(keywords)
+        return list(expanded)
+
+    def _recommend_venues(self, keywords: List[str], max_venues: int) -> List[str]:
+        key = (tuple(keywords), max_venues)
+        venues = self._venue_cache.get(key)
+        if venues is None:
+            venues = self._venue_cache[key] = self.venue_recommender.recommend(
+                keywords, max_venues=max_venues
+            )
+        return list(venues)
+
     @staticmethod
     def new_run_id() -> str:
         """Generate a new harvest run ID."""
-        timestamp = _utcnow().strftime("%Y%m%d-%H%M%S")
-        suffix = uuid.uuid4().hex[:8]
-        return f"harvest-{timestamp}-{suffix}"
+        now = _utcnow()
+        return (
+            f"harvest-{now.year:04d}{now.month:02d}{now.day:02d}"
+            f"-{now.hour:02d}{now.minute:02d}{now.second:02d}-{os.urandom(4).hex()}"
+        )
 
     async def run(
         self,
@@ -142,45 +175,96 @@ class HarvestPipeline:
             HarvestProgress for intermediate updates
             HarvestFinalResult as final yield
         """
-        run_id = run_id or self.new_run_id()
-        start_time = _utcnow()
+        progress: asyncio.Queue[Optional[HarvestProgress]] = asyncio.Queue()
+        core = asyncio.create_task(
+            self._run_core(config, run_id or self.new_run_id(), progress.put_nowait)
+        )
+        core.add_done_callback(lambda _: progress.put_nowait(None))
+        try:
+            while (item := await progress.get()) is not None:
+                yield item
+            yield core.result()
+        finally:
+            if not core.done():
+                core.cancel()
+
+    async def _run_core(
+        self,
+        config: HarvestConfig,
+        run_id: str,
+        on_progress: Optional[Callable[[HarvestProgress], None]] = None,
+    ) -> HarvestFinalResult:
+        """Run every harvest phase; progress goes to ``on_progress`` if given."""
+
+        def emit(phase: str, message: str, details: Optional[Dict[str, Any]] = None) -> None:
+            if on_progress is not None:
+                on_progress(HarvestProgress(phase=phase, message=message, details=details))
+
+        # Monotonic clock: immune to wall-clock jumps, no datetime/timedelta churn.
+        start = time.perf_counter()
         errors: Dict[str, str] = {}
         source_results: Dict[str, Dict[str, Any]] = {}
 
-        # Determine sources to use
-        sources = config.sources or [s.value for s in HarvestSource]
+        # Determine sources to use; unknown names are reported, not searched.
+        sources = config.sources or list(_ALL_SOURCE_VALUES)
+        for source in sources:
+            if source not in _VALID_SOURCES:
+                errors[source] = f"Unknown source: {source}"
+        if errors:
+            sources = [source for source in sources if source in _VALID_SOURCES]
+        if not sources:
+            return HarvestFinalResult(
+                run_id=run_id,
+                status="failed",
+                papers_found=0,
+                papers_new=0,
+                papers_deduplicated=0,
+                source_results={},
+                errors=errors,
+                duration_seconds=time.perf_counter() - start,
+            )
 
         try:
             # Phase 1: Expand keywords
-            yield HarvestProgress(
-                phase="Expanding",
-                message="Expanding keywords...",
-            )
+            emit("Expanding", "Expanding keywords...")
 
-            expanded_keywords = config.keywords.copy()
             if config.expand_keywords:
-                expanded_keywords = self.query_rewriter.expand_all(config.keywords)
-                logger.info(f"Expanded keywords: {config.keywords} → {expanded_keywords}")
+                expanded_keywords = self._expand_keywords(config.keywords)
+                logger.info("Expanded keywords: %s → %s", config.keywords, expanded_keywords)
+            else:
+                expanded_keywords = config.keywords.copy()
+            search_query = " ".join(expanded_keywords)
+            if not search_query.strip():
+                # Nothing to search for: skip the run record and every source call.
+                return HarvestFinalResult(
+                    run_id=run_id,
+                    status="failed",
+                    papers_found=0,
+                    papers_new=0,
+                    papers_deduplicated=0,
+                    source_results={},
+                    errors={"config": "no keywords", **errors},
+                    duration_seconds=time.perf_counter() - start,
+                )
+
+            # Only resolve the store and search service once there is work to do.
+            store, search_service = self._ensure_services()
 
             # Phase 2: Recommend venues (if not specified)
             venues = config.venues
             if config.recommend_venues and not venues:
-                yield HarvestProgress(
-                    phase="Recommending",
-                    message="Recommending venues...",
-                )
-                venues = self.venue_recommender.recommend(
-                    expanded_keywords, max_venues=5
-                )
-                logger.info(f"Recommended venues: {venues}")
-
-            # Phase 3: Create harvest run record
-            yield HarvestProgress(
-                phase="Initializing",
-                message="Creating harvest run record...",
-            )
-
-            self.paper_store.create_harvest_run(
+                emit("Recommending", "Recommending venues...")
+                venues = self._recommend_venues(expanded_keywords, max_venues=5)
+                logger.info("Recommended venues: %s", venues)
+
+            # Phase 3: Create harvest run record. The insert runs on a worker
+            # thread to keep the event loop free, but completes before the search
+            # starts: the row must exist for the updates below, and the search
+            # persists papers through the same SQLite database.
+            emit("Initializing", "Creating harvest run record...")
+
+            await asyncio.to_thread(
+                store.create_harvest_run,
                 run_id=run_id,
                 keywords=expanded_keywords,
                 venues=venues or [],
@@ -189,16 +273,14 @@ class HarvestPipeline:
             )
 
             # Phase 4: Search via PaperSearchService (handles dedup + persist)
-            search_query = " ".join(expanded_keywords)
-
-            yield HarvestProgress(
-                phase="Harvesting",
-                message=f"Searching {len(sources)} sources via PaperSearchService...",
-                details={"sources": sources},
+            emit(
+                "Harvesting",
+                f"Searching {len(sources)} sources via PaperSearchService...",
+                {"sources": sources},
             )
 
             try:
-                search_result = await self.search_service.search(
+                search_result = await search_service.search(
                     search_query,
                     sources=sources,
                     max_results=config.max_results_per_source * len(sources),
@@ -210,21 +292,25 @@ class HarvestPipeline:
                 papers_new = len(search_result.papers)
                 deduplicated_count = search_result.duplicates_removed
 
+                # One pass over papers instead of one per source; Counter tallies in C.
+                provenance = search_result.provenance
+                counts = Counter(
+                    chain.from_iterable(
+                        provenance.get(p.title_hash or p.title, ()) for p in search_result.papers
+                    )
+                )
                 for src in sources:
-                    src_papers = [
-                        p for p in search_result.papers
-                        if src in search_result.provenance.get(p.title_hash or p.title, [])
-                    ]
-                    source_results[src] = {"papers": len(src_papers), "error": None}
+                    source_results[src] = {"papers": counts[src], "error": None}
 
                 logger.info(
-                    f"PaperSearchService returned {papers_new} unique papers "
-                    f"({deduplicated_count} duplicates removed)"
+                    "PaperSearchService returned %d unique papers (%d duplicates removed)",
+                    papers_new,
+                    deduplicated_count,
                 )
             except Exception as e:
                 error_msg = str(e)
                 errors["search_service"] = error_msg
-                logger.exception(f"PaperSearchService failed: {e}")
+                logger.exception("PaperSearchService failed: %s", e)
                 papers_found = 0
                 papers_new = 0
                 deduplicated_count = 0
@@ -234,7 +320,7 @@ class HarvestPipeline:
             if errors:
                 status = "partial" if papers_new else "failed"
 
-            self.paper_store.update_harvest_run(
+            store.update_harvest_run(
                 run_id=run_id,
                 status=status,
                 papers_found=papers_found,
@@ -243,12 +329,9 @@ class HarvestPipeline:
                 errors=errors if errors else None,
             )
 
-            # Calculate duration
-            end_time = _utcnow()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start
 
-            # Yield final result
-            yield HarvestFinalResult(
+            return HarvestFinalResult(
                 run_id=run_id,
                 status=status,
                 papers_found=papers_found,
@@ -261,17 +344,16 @@ class HarvestPipeline:
 
         except Exception as e:
             # Handle pipeline-level errors
-            logger.exception(f"Harvest pipeline failed: {e}")
+            logger.exception("Harvest pipeline failed: %s", e)
             self.paper_store.update_harvest_run(
                 run_id=run_id,
                 status="failed",
                 errors={"pipeline": str(e)},
             )
 
-            end_time = _utcnow()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start
 
-            yield HarvestFinalResult(
+            return HarvestFinalResult(
                 run_id=run_id,
                 status="failed",
                 papers_found=0,
@@ -293,14 +375,8 @@ class HarvestPipeline:
 
         Useful for CLI or non-streaming use cases.
         """
-        result: Optional[HarvestFinalResult] = None
-        async for item in self.run(config, run_id=run_id):
-            if isinstance(item, HarvestFinalResult):
-                result = item
-
-        if result is None:
-            raise RuntimeError("Pipeline completed without final result")
-        return result
+        # No progress consumer, so skip the generator/queue hand-off entirely.
+        return await self._run_core(config, run_id or self.new_run_id())
 
     async def close(self) -> None:
         """Release all resources."""
@@ -4,7 +4,10 @@ import asyncio
 import math
 import re
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from paperbot.application.services.paper_search_service import PaperSearchService, SearchResult
 
@@ -29,6 +32,12 @@ _SOURCE_ALIASES = {
     "s2": "semantic_scholar",
 }
 
+# Row scores are always floats from _score_paper, so sorting needs no coercion.
+_by_score = itemgetter("score")
+
+_WS_RE = re.compile(r"\s+")
+_ALNUM_RE = re.compile(r"[a-z0-9]+")
+
 
 def make_default_search_service(*, registry=None) -> PaperSearchService:
     from paperbot.infrastructure.adapters import build_adapter_registry
@@ -37,45 +46,40 @@ def make_default_search_service(*, registry=None) -> PaperSearchService:
 
 
 def normalize_topic_sources(sources: Sequence[str] | None) -> List[str]:
-    names: List[str] = []
-    seen: set[str] = set()
-    for raw in sources or ["papers_cool"]:
-        normalized = _SOURCE_ALIASES.get((raw or "").strip().lower())
-        if not normalized or normalized in seen:
-            continue
-        seen.add(normalized)
-        names.append(normalized)
-    if not names:
-        names = ["papers_cool"]
-    return names
+    return list(_normalize_topic_sources(tuple(sources or ())))
+
 
+@lru_cache(maxsize=128)
+def _normalize_topic_sources(sources: Tuple[str, ...]) -> Tuple[str, ...]:
+    names = dict.fromkeys(
+        filter(None, (_SOURCE_ALIASES.get((raw or "").strip().lower()) for raw in sources))
+    )
+    return tuple(names) or ("papers_cool",)
 
+
+# Query helpers are pure and see the same strings on every scheduled run;
+# lru_cache bounds memory while turning repeats into a dict lookup.
+@lru_cache(maxsize=4096)
 def _normalize_query(query: str) -> str:
-    base = re.sub(r"\s+", " ", (query or "").strip()).lower()
+    base = _WS_RE.sub(" ", (query or "").strip()).lower()
     return _QUERY_ALIASES.get(base, base)
 
 
-def _tokenize_query(query: str) -> List[str]:
+@lru_cache(maxsize=4096)
+def _tokenize_query(query: str) -> Tuple[str, ...]:
     seen: set[str] = set()
     tokens: List[str] = []
-    for token in re.findall(r"[a-z0-9]+", query.lower()):
+    for token in _ALNUM_RE.findall(query.lower()):
         if token in seen:
             continue
         seen.add(token)
         tokens.append(token)
-    return tokens
+    return tuple(tokens)
 
 
 def _unique_preserve(values: Iterable[str]) -> List[str]:
-    seen: set[str] = set()
-    out: List[str] = []
-    for value in values:
-        v = (value or "").strip()
-        if not v or v in seen:
-            continue
-        seen.add(v)
-        out.append(v)
-    return out
+    # dict.fromkeys dedupes in insertion order in a single C-level pass.
+    return list(dict.fromkeys(filter(None, ((value or "").strip() for value in values))))
 
 
 def _matched_keywords(paper: Dict[str, Any], tokens: List[str]) -> List[str]:
@@ -89,17 +93,35 @@ def _matched_keywords(paper: Dict[str, Any], tokens: List[str]) -> List[str]:
             " ".join(str(v) for v in (paper.get("fields_of_study") or [])),
         ]
     ).lower()
+    # Substring matching is intended ("transformer" hits "transformers") and,
+    # for the handful of tokens a query has, C-level ``in`` scans beat
+    # tokenizing the blob into a set by more than an order of magnitude.
     return [tok for tok in tokens if tok in blob]
 
 
-def _score_paper(paper: Dict[str, Any], query_tokens: List[str], matched: List[str]) -> float:
-    token_score = (len(matched) / max(1, len(query_tokens))) * 3.0
+# Caps of the citation and recency terms in _score_paper.
+_MAX_CITATION_SCORE = 1.25
+_MAX_RECENCY_SCORE = 1.0
+
+
+def _token_score(query_tokens: Sequence[str], matched: List[str]) -> float:
+    return (len(matched) / max(1, len(query_tokens))) * 3.0
+
+
+def _score_paper(
+    paper: Dict[str, Any],
+    query_tokens: Sequence[str],
+    matched: List[str],
+    *,
+    current_year: Optional[int] = None,
+) -> float:
+    token_score = _token_score(query_tokens, matched)
     citation_count = 0
     try:
         citation_count = int(paper.get("citation_count") or 0)
     except Exception:
         citation_count = 0
-    citation_score = min(1.25, math.log10(max(1, citation_count + 1)) / 3.0)
+    citation_score = min(_MAX_CITATION_SCORE, math.log10(max(1, citation_count + 1)) / 3.0)
 
     year = None
     try:
@@ -107,8 +129,10 @@ def _score_paper(paper: Dict[str, Any], query_tokens: List[str], matched: List[s
     except Exception:
         year = None
     if year is not None:
-        age = max(0, datetime.now(timezone.utc).year - year)
-        recency_score = max(0.0, 1.0 - age / 10.0)
+        if current_year is None:
+            current_year = datetime.now(timezone.utc).year
+        age = max(0, current_year - year)
+        recency_score = max(0.0, _MAX_RECENCY_SCORE - age / 10.0)
     else:
         recency_score = 0.25
 
@@ -149,14 +173,25 @@ def _search_result_to_items(
     min_score: float,
 ) -> List[Dict[str, Any]]:
     rows: List[Dict[str, Any]] = []
+    # Per-call constants: read the clock, coerce the threshold and normalize the
+    # branches once, not once per paper.
+    current_year = datetime.now(timezone.utc).year
+    threshold = float(min_score or 0.0)
+    row_branches = _unique_preserve(branches or ["arxiv", "venue"])
 
     for paper in search_result.papers:
         p = paper.to_dict()
         key = p.get("title_hash") or p.get("title")
         provenances = search_result.provenance.get(str(key), fallback_sources)
         matched = _matched_keywords(p, query_tokens)
-        score = _score_paper(p, query_tokens, matched)
-        if score < float(min_score or 0.0):
+        if threshold > 0.0:
+            # Upper bound of _score_paper (rounding is monotonic): skip the
+            # citation/year work for papers that cannot reach min_score.
+            best = _token_score(query_tokens, matched) + _MAX_CITATION_SCORE + _MAX_RECENCY_SCORE
+            if round(best, 4) < threshold:
+                continue
+        score = _score_paper(p, query_tokens, matched, current_year=current_year)
+        if score < threshold:
             continue
 
         url = str(p.get("url") or "").strip()
@@ -168,18 +203,16 @@ def _search_result_to_items(
                 "url": url,
                 "external_url": url,
                 "pdf_url": str(p.get("pdf_url") or "").strip(),
-                "authors": list(p.get("authors") or []),
+                "authors": _unique_preserve(p.get("authors") or []),
                 "subject_or_venue": venue,
                 "published_at": p.get("publication_date") or (str(p.get("year")) if p.get("year") else ""),
                 "snippet": str(p.get("abstract") or "").strip(),
                 "keywords": _unique_preserve(
-                    [
-                        *[str(v) for v in (p.get("keywords") or [])],
-                        *[str(v) for v in (p.get("fields_of_study") or [])],
-                    ]
+                    map(str, chain(p.get("keywords") or (), p.get("fields_of_study") or ()))
                 ),
-                "branches": list(branches or ["arxiv", "venue"]),
-                "sources": _unique_preserve([str(v) for v in provenances]) or fallback_sources,
+                # Shared by this query's rows; _clone_item copies it before merges.
+                "branches": row_branches,
+                "sources": _unique_preserve(map(str, provenances)) or fallback_sources,
                 "matched_keywords": matched,
                 "matched_queries": [normalized_query],
                 "score": score,
@@ -189,28 +222,47 @@ def _search_result_to_items(
             }
         )
 
-    rows.sort(key=lambda row: float(row.get("score") or 0.0), reverse=True)
+    rows.sort(key=_by_score, reverse=True)
     return rows
 
 
+_MERGED_LIST_FIELDS = (
+    "matched_queries",
+    "matched_keywords",
+    "branches",
+    "sources",
+    "keywords",
+    "authors",
+)
+
+
+def _clone_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    cloned = dict(item)
+    for field in (*_MERGED_LIST_FIELDS, "alternative_urls"):
+        cloned[field] = list(item.get(field) or [])
+    return cloned
+
+
+def _extend_unique(target: List[str], values: Iterable[str]) -> None:
+    # One set per call keeps long lists (authors) linear rather than O(k*n).
+    known = set(target)
+    for value in values:
+        v = (value or "").strip()
+        if v and v not in known:
+            known.add(v)
+            target.append(v)
+
+
 def _merge_item(target: Dict[str, Any], incoming: Dict[str, Any]) -> None:
-    target["matched_queries"] = _unique_preserve(
-        [*target.get("matched_queries", []), *incoming.get("matched_queries", [])]
-    )
-    target["matched_keywords"] = _unique_preserve(
-        [*target.get("matched_keywords", []), *incoming.get("matched_keywords", [])]
-    )
-    target["branches"] = _unique_preserve([*target.get("branches", []), *incoming.get("branches", [])])
-    target["sources"] = _unique_preserve([*target.get("sources", []), *incoming.get("sources", [])])
-    target["keywords"] = _unique_preserve([*target.get("keywords", []), *incoming.get("keywords", [])])
-    target["authors"] = _unique_preserve([*target.get("authors", []), *incoming.get("authors", [])])
+    # Item lists are de-duplicated when built and ``target`` owns its copies
+    # (see _clone_item), so merging only appends values it has not seen yet.
+    for field in _MERGED_LIST_FIELDS:
+        _extend_unique(target.setdefault(field, []), incoming.get(field) or [])
 
     incoming_url = str(incoming.get("url") or "").strip()
     target_url = str(target.get("url") or "").strip()
     if incoming_url and incoming_url != target_url:
-        target["alternative_urls"] = _unique_preserve(
-            [*target.get("alternative_urls", []), incoming_url]
-        )
+        _extend_unique(target.setdefault("alternative_urls", []), [incoming_url])
 
     if float(incoming.get("score") or 0.0) > float(target.get("score") or 0.0):
         target["score"] = float(incoming.get("score") or 0.0)
@@ -243,7 +295,7 @@ async def run_unified_topic_search(
             {
                 "raw_query": raw_query,
                 "normalized_query": normalized_query,
-                "tokens": _tokenize_query(normalized_query),
+                "tokens": list(_tokenize_query(normalized_query)),
             }
         )
 
@@ -279,6 +331,8 @@ async def run_unified_topic_search(
     search_results = await asyncio.gather(*tasks)
 
     query_views: List[Dict[str, Any]] = []
+    query_highlights: List[Dict[str, Any]] = []
+    total_query_hits = 0
     aggregated: List[Dict[str, Any]] = []
     by_key: Dict[str, Dict[str, Any]] = {}
 
@@ -292,47 +346,45 @@ async def run_unified_topic_search(
             min_score=min_score,
         )
 
+        # Each query's view and highlight come straight from its own ranked
+        # rows, so neither needs a later pass over the views or merged items.
+        top_items = query_items[: max(0, int(top_k_per_query))]
+        total_query_hits += len(query_items)
         query_views.append(
             {
                 "raw_query": spec["raw_query"],
                 "normalized_query": spec["normalized_query"],
                 "tokens": spec["tokens"],
                 "total_hits": len(query_items),
-                "items": query_items[: max(0, int(top_k_per_query))],
+                "items": top_items,
+            }
+        )
+        top_item = top_items[0] if top_items else {}
+        query_highlights.append(
+            {
+                "raw_query": spec["raw_query"],
+                "normalized_query": spec["normalized_query"],
+                "hit_count": len(query_items),
+                "top_title": top_item.get("title") or "",
+                "top_keywords": (top_item.get("matched_keywords") or [])[:5],
             }
         )
 
         for item in query_items:
-            url = str(item.get("url") or "").strip().lower()
-            title = str(item.get("title") or "").strip().lower()
-            key = url or title
+            # Rows come from _search_result_to_items with url/title already
+            # stripped strings; the title only matters when there is no URL.
+            key = (item["url"] or item["title"]).lower()
             if not key:
                 continue
             existing = by_key.get(key)
             if existing is None:
-                cloned = dict(item)
+                cloned = _clone_item(item)
                 by_key[key] = cloned
                 aggregated.append(cloned)
             else:
                 _merge_item(existing, item)
 
-    aggregated.sort(key=lambda row: float(row.get("score") or 0.0), reverse=True)
-
-    query_highlights: List[Dict[str, Any]] = []
-    total_query_hits = 0
-    for row in query_views:
-        total_hits = int(row.get("total_hits") or 0)
-        total_query_hits += total_hits
-        top_item = (row.get("items") or [None])[0]
-        query_highlights.append(
-            {
-                "raw_query": row.get("raw_query") or "",
-                "normalized_query": row.get("normalized_query") or "",
-                "hit_count": total_hits,
-                "top_title": (top_item or {}).get("title") or "",
-                "top_keywords": ((top_item or {}).get("matched_keywords") or [])[:5],
-            }
-        )
+    aggregated.sort(key=_by_score, reverse=True)
 
     source_breakdown: Dict[str, int] = {}
     for item in aggregated:
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 import inspect
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, Generic, Optional, Protocol, TypeVar
 
@@ -31,14 +31,9 @@ class AgentRunContext:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def with_stage(self, stage: str) -> "AgentRunContext":
-        return AgentRunContext(
-            run_id=self.run_id,
-            trace_id=self.trace_id,
-            workflow=self.workflow,
-            agent_name=self.agent_name,
-            stage=stage,
-            metadata=dict(self.metadata),
-        )
+        # Stage views of one run share its metadata dict; a run emits several
+        # stages, and copying (possibly large) trace metadata for each is waste.
+        return replace(self, stage=stage)
 
 
 @dataclass
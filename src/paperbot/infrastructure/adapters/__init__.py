@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Callable, Dict
 
 from paperbot.application.ports.paper_search_port import SearchPort
 from paperbot.infrastructure.adapters.arxiv_search_adapter import ArxivSearchAdapter
@@ -12,11 +12,15 @@ from paperbot.infrastructure.adapters.paperscool_adapter import PapersCoolAdapte
 from paperbot.infrastructure.adapters.s2_search_adapter import S2SearchAdapter
 
 
+# Source name -> adapter factory. Extend this table to register a new source.
+_ADAPTER_FACTORIES: Dict[str, Callable[[], SearchPort]] = {
+    "semantic_scholar": S2SearchAdapter,
+    "arxiv": ArxivSearchAdapter,
+    "papers_cool": PapersCoolAdapter,
+    "hf_daily": HFDailyAdapter,
+    "openalex": OpenAlexAdapter,
+}
+
+
 def build_adapter_registry() -> Dict[str, SearchPort]:
-    return {
-        "semantic_scholar": S2SearchAdapter(),
-        "arxiv": ArxivSearchAdapter(),
-        "papers_cool": PapersCoolAdapter(),
-        "hf_daily": HFDailyAdapter(),
-        "openalex": OpenAlexAdapter(),
-    }
+    return {name: factory() for name, factory in _ADAPTER_FACTORIES.items()}
@@ -25,6 +25,21 @@ def _event_log() -> SqlAlchemyEventLog:
     return SqlAlchemyEventLog()
 
 
+_paper_search_service = None
+
+
+def _get_paper_search_service():
+    # Adapters hold HTTP clients; build them once per worker, not once per job.
+    global _paper_search_service
+    if _paper_search_service is None:
+        from paperbot.application.workflows.unified_topic_search import (
+            make_default_search_service,
+        )
+
+        _paper_search_service = make_default_search_service()
+    return _paper_search_service
+
+
 def _subscription_service() -> SubscriptionService:
     """
     Load subscription list from a fixed YAML file.
@@ -356,10 +371,13 @@ async def daily_papers_job(
     output_dir: str = "./reports/dailypaper",
     enable_llm_analysis: bool = False,
     llm_features: Optional[List[str]] = None,
+    llm_max_items_per_query: int = 3,
+    llm_max_workers: int = 8,
     enable_judge: bool = False,
     judge_runs: int = 1,
     judge_max_items_per_query: int = 5,
     judge_token_budget: int = 0,
+    judge_max_workers: int = 4,
     notify: bool = False,
     notify_channels: Optional[List[str]] = None,
     save: bool = True,
@@ -414,9 +432,7 @@ async def daily_papers_job(
 
     from paperbot.application.workflows.dailypaper import (
         DailyPaperReporter,
-        apply_judge_scores_to_report,
-        build_daily_paper_report,
-        enrich_daily_paper_report,
+        compose_daily_report,
         extract_figures_for_report,
         ingest_daily_report_to_registry,
         normalize_llm_features,
@@ -425,13 +441,10 @@ async def daily_papers_job(
         render_daily_paper_markdown,
     )
     from paperbot.application.services.daily_push_service import DailyPushService
-    from paperbot.application.workflows.unified_topic_search import (
-        make_default_search_service,
-        run_unified_topic_search,
-    )
+    from paperbot.application.workflows.unified_topic_search import run_unified_topic_search
     from paperbot.workflows.feed import ScholarFeedService
 
-    search_service = make_default_search_service()
+    search_service = _get_paper_search_service()
     search_result = await run_unified_topic_search(
         queries=job_queries,
         sources=job_sources,
@@ -441,21 +454,21 @@ async def daily_papers_job(
         search_service=search_service,
         persist=False,
     )
-    report = build_daily_paper_report(
-        search_result=search_result, title=title, top_n=max(1, int(top_n))
+    report = compose_daily_report(
+        search_result=search_result,
+        title=title,
+        top_n=max(1, int(top_n)),
+        llm_features=(
+            normalize_llm_features(llm_features or ["summary"]) if enable_llm_analysis else ()
+        ),
+        llm_max_items_per_query=max(1, int(llm_max_items_per_query)),
+        llm_max_workers=max(1, int(llm_max_workers)),
+        enable_judge=bool(enable_judge),
+        judge_max_items_per_query=max(1, int(judge_max_items_per_query)),
+        judge_runs=max(1, int(judge_runs)),
+        judge_token_budget=max(0, int(judge_token_budget)),
+        judge_max_workers=max(1, int(judge_max_workers)),
     )
-    if enable_llm_analysis:
-        report = enrich_daily_paper_report(
-            report,
-            llm_features=normalize_llm_features(llm_features or ["summary"]),
-        )
-    if enable_judge:
-        report = apply_judge_scores_to_report(
-            report,
-            max_items_per_query=max(1, int(judge_max_items_per_query)),
-            n_runs=max(1, int(judge_runs)),
-            judge_token_budget=max(0, int(judge_token_budget)),
-        )
 
     if enable_figures:
         mineru_key = os.getenv("MINERU_API_KEY", "")
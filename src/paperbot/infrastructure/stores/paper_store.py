@@ -112,7 +112,81 @@ class PaperStore:
         sync_authors: bool = True,
     ) -> Dict[str, Any]:
         now = _utcnow()
+        authors = _safe_list(paper.get("authors"))
+
+        with self._provider.session() as session:
+            row, created = self._apply_paper(
+                session, paper=paper, source_hint=source_hint, seen_at=seen_at, now=now
+            )
+            session.commit()
+            session.refresh(row)
+
+            payload = self._paper_to_dict(row)
+            payload["_created"] = created
+
+            # Dual-write: also populate paper_identifiers
+            self._sync_identifiers(session, row)
+
+            # Extract and link authors to authors/paper_authors tables
+            if sync_authors and authors and row.id:
+                try:
+                    self._author_store.replace_paper_authors(
+                        paper_id=int(row.id),
+                        authors=authors,
+                    )
+                except Exception as e:
+                    Logger.warning(
+                        f"Failed to sync paper authors for paper {row.id}: {e}",
+                        file=LogFiles.HARVEST,
+                    )
+
+            return payload
 
+    def upsert_papers(
+        self,
+        *,
+        papers: Iterable[Tuple[Dict[str, Any], Optional[str]]],
+        seen_at: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """Upsert ``(paper, source_hint)`` pairs in a single transaction.
+
+        Same matching and merge rules as :meth:`upsert_paper` (without author
+        sync), but one commit for the whole batch instead of one per paper.
+        Any failure rolls the whole batch back and propagates.
+        """
+        now = _utcnow()
+        with self._provider.session() as session:
+            results: List[Tuple[PaperModel, bool]] = []
+            for paper, source_hint in papers:
+                results.append(
+                    self._apply_paper(
+                        session, paper=paper, source_hint=source_hint, seen_at=seen_at, now=now
+                    )
+                )
+                # The session does not autoflush; flush so later papers in the
+                # batch can match rows created earlier in it.
+                session.flush()
+            session.commit()
+
+            payloads = []
+            for row, created in results:
+                payload = self._paper_to_dict(row)
+                payload["_created"] = created
+                payloads.append(payload)
+            for row, _ in results:
+                self._sync_identifiers(session, row)
+            return payloads
+
+    def _apply_paper(
+        self,
+        session,
+        *,
+        paper: Dict[str, Any],
+        source_hint: Optional[str],
+        seen_at: Optional[datetime],
+        now: datetime,
+    ) -> Tuple[PaperModel, bool]:
+        """Find or create the row for ``paper`` and merge its fields in, uncommitted."""
         title = str(paper.get("title") or "").strip()
         url = str(paper.get("url") or "").strip()
         external_url = str(paper.get("external_url") or "").strip()
@@ -186,106 +260,81 @@ class PaperStore:
         normalized_title = title.lower().strip() or "untitled"
         title_hash = hashlib.sha256(normalized_title.encode("utf-8")).hexdigest()
 
-        with self._provider.session() as session:
-            row = None
-            if arxiv_id:
-                row = session.execute(
-                    select(PaperModel).where(PaperModel.arxiv_id == arxiv_id)
-                ).scalar_one_or_none()
-            if row is None and doi:
-                row = session.execute(
-                    select(PaperModel).where(PaperModel.doi == doi)
-                ).scalar_one_or_none()
-            if row is None and semantic_scholar_id:
-                row = session.execute(
-                    select(PaperModel).where(PaperModel.semantic_scholar_id == semantic_scholar_id)
-                ).scalar_one_or_none()
-            if row is None and openalex_id:
-                row = session.execute(
-                    select(PaperModel).where(PaperModel.openalex_id == openalex_id)
-                ).scalar_one_or_none()
-            if row is None and url:
-                row = session.execute(
-                    select(PaperModel).where(PaperModel.url == url)
-                ).scalar_one_or_none()
-            if row is None and title:
-                row = (
-                    session.execute(
-                        select(PaperModel)
-                        .where(func.lower(PaperModel.title) == title.lower())
-                        .limit(1)
-                    )
-                    .scalars()
-                    .first()
-                )
-
-            created = row is None
-            if row is None:
-                row = PaperModel(
-                    title_hash=title_hash,
-                    first_seen_at=seen_at or now,
-                    created_at=now,
-                    updated_at=now,
+        row = None
+        if arxiv_id:
+            row = session.execute(
+                select(PaperModel).where(PaperModel.arxiv_id == arxiv_id)
+            ).scalar_one_or_none()
+        if row is None and doi:
+            row = session.execute(
+                select(PaperModel).where(PaperModel.doi == doi)
+            ).scalar_one_or_none()
+        if row is None and semantic_scholar_id:
+            row = session.execute(
+                select(PaperModel).where(PaperModel.semantic_scholar_id == semantic_scholar_id)
+            ).scalar_one_or_none()
+        if row is None and openalex_id:
+            row = session.execute(
+                select(PaperModel).where(PaperModel.openalex_id == openalex_id)
+            ).scalar_one_or_none()
+        if row is None and url:
+            row = session.execute(
+                select(PaperModel).where(PaperModel.url == url)
+            ).scalar_one_or_none()
+        if row is None and title:
+            row = (
+                session.execute(
+                    select(PaperModel).where(func.lower(PaperModel.title) == title.lower()).limit(1)
                 )
-                session.add(row)
-
-            if arxiv_id:
-                row.arxiv_id = arxiv_id
-            if doi:
-                row.doi = doi
-            if semantic_scholar_id:
-                row.semantic_scholar_id = semantic_scholar_id
-            if openalex_id:
-                row.openalex_id = openalex_id
-            row.title_hash = title_hash
-            row.title = title or row.title or ""
-            row.abstract = abstract or row.abstract or ""
-            row.url = url or row.url or ""
-            row.pdf_url = pdf_url or row.pdf_url or ""
-            row.venue = venue or row.venue or ""
-            row.year = year if year is not None else row.year
-            row.publication_date = publication_date or row.publication_date
-            row.citation_count = max(citation_count, int(row.citation_count or 0))
-
-            if authors:
-                row.authors_json = json.dumps(authors, ensure_ascii=False)
-            if keywords:
-                row.keywords_json = json.dumps(keywords, ensure_ascii=False)
-            if fields_of_study:
-                row.fields_of_study_json = json.dumps(fields_of_study, ensure_ascii=False)
-
-            source_text = str(source or "").strip() or "papers_cool"
-            row.primary_source = source_text
-            existing_sources = row.get_sources()
-            merged_sources = (
-                sorted({*existing_sources, source_text}) if source_text else existing_sources
+                .scalars()
+                .first()
             )
-            row.set_sources(merged_sources)
 
-            row.updated_at = now
-            session.commit()
-            session.refresh(row)
-
-            payload = self._paper_to_dict(row)
-            payload["_created"] = created
-
-            # Dual-write: also populate paper_identifiers
-            self._sync_identifiers(session, row)
-
-            # Extract and link authors to authors/paper_authors tables
-            if sync_authors and authors and row.id:
-                try:
-                    self._author_store.replace_paper_authors(
-                        paper_id=int(row.id),
-                        authors=authors,
-                    )
-                except Exception as e:
-                    Logger.warning(
-                        f"Failed to sync paper authors for paper {row.id}: {e}",
-                        file=LogFiles.HARVEST,
-                    )
+        created = row is None
+        if row is None:
+            row = PaperModel(
+                title_hash=title_hash,
+                first_seen_at=seen_at or now,
+                created_at=now,
+                updated_at=now,
+            )
+            session.add(row)
+
+        if arxiv_id:
+            row.arxiv_id = arxiv_id
+        if doi:
+            row.doi = doi
+        if semantic_scholar_id:
+            row.semantic_scholar_id = semantic_scholar_id
+        if openalex_id:
+            row.openalex_id = openalex_id
+        row.title_hash = title_hash
+        row.title = title or row.title or ""
+        row.abstract = abstract or row.abstract or ""
+        row.url = url or row.url or ""
+        row.pdf_url = pdf_url or row.pdf_url or ""
+        row.venue = venue or row.venue or ""
+        row.year = year if year is not None else row.year
+        row.publication_date = publication_date or row.publication_date
+        row.citation_count = max(citation_count, int(row.citation_count or 0))
+
+        if authors:
+            row.authors_json = json.dumps(authors, ensure_ascii=False)
+        if keywords:
+            row.keywords_json = json.dumps(keywords, ensure_ascii=False)
+        if fields_of_study:
+            row.fields_of_study_json = json.dumps(fields_of_study, ensure_ascii=False)
+
+        source_text = str(source or "").strip() or "papers_cool"
+        row.primary_source = source_text
+        existing_sources = row.get_sources()
+        merged_sources = (
+            sorted({*existing_sources, source_text}) if source_text else existing_sources
+        )
+        row.set_sources(merged_sources)
 
-            return payload
+        row.updated_at = now
+        return row, created
 
     @staticmethod
     def _sync_identifiers(session, row: PaperModel) -> None:
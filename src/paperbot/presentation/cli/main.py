@@ -35,10 +35,26 @@ from paperbot.application.workflows.unified_topic_search import (
 from paperbot.infrastructure.stores.paper_store import PaperStore
 from paperbot.infrastructure.stores.pipeline_session_store import PipelineSessionStore
 
+try:
+    import uvloop
+except ImportError:  # optional: faster event loop
+    uvloop = None
+
 # Load local .env automatically for CLI workflows using LLM providers.
 load_dotenv(find_dotenv(usecwd=True), override=False)
 
 
+def _run_async(coro):
+    """Run a CLI coroutine, on uvloop when it is installed.
+
+    The API server already gets uvloop through uvicorn's ``loop="auto"``;
+    this gives CLI workflows the same cheaper per-await scheduling.
+    """
+    if uvloop is not None and hasattr(uvloop, "run"):
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 def create_parser() -> argparse.ArgumentParser:
     """创建 CLI 参数解析器"""
     parser = argparse.ArgumentParser(
@@ -261,7 +277,7 @@ def run_cli(args: Optional[list] = None) -> int:
             run_main()
 
         elif parsed.command == "score":
-            asyncio.run(_quick_score(parsed.paper_id))
+            _run_async(_quick_score(parsed.paper_id))
 
         elif parsed.command == "topic-search":
             return _run_topic_search(parsed)
@@ -309,7 +325,7 @@ def _run_topic_search(parsed: argparse.Namespace) -> int:
     branches = parsed.branches or ["arxiv", "venue"]
     sources = parsed.sources or ["papers_cool"]
 
-    result = asyncio.run(
+    result = _run_async(
         run_unified_topic_search(
             queries=queries,
             sources=sources,
@@ -371,7 +387,7 @@ def _run_daily_paper(parsed: argparse.Namespace) -> int:
         )
     else:
         effective_top_k = max(1, int(parsed.top_k), int(parsed.top_n))
-        search_result = asyncio.run(
+        search_result = _run_async(
             run_unified_topic_search(
                 queries=queries,
                 sources=sources,
@@ -36,6 +36,19 @@ async def test_base_agent_runtime_run_emits_events():
     assert [e.kind for e in events] == ["input", "plan", "result", "finalize"]
 
 
+def test_with_stage_shares_run_metadata():
+    context = AgentRunContext(
+        run_id="r3", trace_id="t3", workflow="wf", metadata={"trace": ["a", "b"]}
+    )
+
+    staged = context.with_stage("plan")
+
+    assert staged.stage == "plan"
+    assert context.stage == "input"
+    assert (staged.run_id, staged.trace_id, staged.workflow) == ("r3", "t3", "wf")
+    assert staged.metadata is context.metadata
+
+
 @pytest.mark.asyncio
 async def test_legacy_method_runtime_supports_sync_and_async_methods():
     legacy = _LegacyAgent()
@@ -109,6 +109,48 @@ def test_enrich_with_digest_card():
     assert item["digest_card"]["tags"] == ["LLM", "efficiency"]
 
 
+def test_digest_card_extracted_once_for_paper_in_several_queries():
+    calls = []
+
+    class _CountingLLMService(_FakeLLMService):
+        def extract_daily_digest_card(self, title: str, abstract: str):
+            calls.append(title)
+            return super().extract_daily_digest_card(title, abstract)
+
+    search_result = _sample_search_result()
+    search_result["queries"].append(dict(search_result["queries"][0], normalized_query="other"))
+    report = build_daily_paper_report(search_result=search_result, title="Digest Test", top_n=5)
+    enriched = enrich_daily_paper_report(
+        report,
+        llm_service=_CountingLLMService(),
+        llm_features=["digest_card"],
+    )
+    first, second = (q["top_items"][0]["digest_card"] for q in enriched["queries"])
+
+    assert calls == ["TestPaper"]
+    assert first == second
+    assert first is not second
+
+
+def test_digest_card_fallback_tags_are_not_shared():
+    class _FailingLLMService(_FakeLLMService):
+        def extract_daily_digest_card(self, title: str, abstract: str):
+            raise RuntimeError("llm down")
+
+    search_result = _sample_search_result()
+    search_result["queries"].append(dict(search_result["queries"][0], normalized_query="other"))
+    report = build_daily_paper_report(search_result=search_result, title="Digest Test", top_n=5)
+    enriched = enrich_daily_paper_report(
+        report,
+        llm_service=_FailingLLMService(),
+        llm_features=["digest_card"],
+    )
+    first, second = (q["top_items"][0]["digest_card"] for q in enriched["queries"])
+    first["tags"].append("mutated")
+
+    assert second["tags"] == []
+
+
 def test_digest_card_in_markdown_output():
     report = build_daily_paper_report(
         search_result=_sample_search_result(), title="Digest Test", top_n=5,
@@ -3,6 +3,7 @@ from paperbot.application.workflows.dailypaper import (
     _is_publishable_figure_url,
     apply_judge_scores_to_report,
     build_daily_paper_report,
+    compose_daily_report,
     enrich_daily_paper_report,
     normalize_llm_features,
     normalize_output_formats,
@@ -81,6 +82,21 @@ def test_build_and_render_daily_report(tmp_path):
     assert artifacts.json_path is not None
 
 
+def test_build_and_write_use_supplied_now(tmp_path):
+    from datetime import datetime, timezone
+
+    now = datetime(2025, 3, 4, 5, 6, 7, tzinfo=timezone.utc)
+    report = build_daily_paper_report(search_result=_sample_search_result(), top_n=5, now=now)
+    assert report["date"] == "2025-03-04"
+    assert report["generated_at"] == now.isoformat()
+
+    del report["date"]
+    artifacts = DailyPaperReporter(output_dir=str(tmp_path)).write(
+        report=report, markdown="# x", formats=["markdown"], slug="fixed", now=now
+    )
+    assert artifacts.markdown_path.endswith("2025-03-04-fixed.md")
+
+
 def test_enrich_daily_report_with_llm_features():
     report = build_daily_paper_report(
         search_result=_sample_search_result(), title="My Daily", top_n=5
@@ -176,7 +192,7 @@ def test_apply_judge_scores_to_report(monkeypatch):
             }
 
     class _FakeJudge:
-        def __init__(self, llm_service=None):
+        def __init__(self, llm_service=None, max_workers=1):
             pass
 
         def judge_batch(self, *, papers, query, n_runs=1):
@@ -201,7 +217,7 @@ def test_apply_judge_scores_respects_token_budget(monkeypatch):
     )
 
     class _FakeJudge:
-        def __init__(self, llm_service=None):
+        def __init__(self, llm_service=None, max_workers=1):
             pass
 
         def judge_batch(self, *, papers, query, n_runs=1):
@@ -225,3 +241,346 @@ def test_apply_judge_scores_respects_token_budget(monkeypatch):
     assert judged["judge"]["budget"]["token_budget"] == 1
     assert judged["judge"]["budget"]["judged_items"] == 0
     assert judged["judge"]["budget"]["skipped_due_budget"] == 1
+
+
+def test_apply_judge_scores_bounds_total_llm_concurrency():
+    import json
+    import threading
+    import time
+
+    class _TrackingLLM:
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.in_flight = 0
+            self.peak = 0
+            self.calls = 0
+
+        def complete(self, **kwargs):
+            with self.lock:
+                self.in_flight += 1
+                self.calls += 1
+                self.peak = max(self.peak, self.in_flight)
+            time.sleep(0.01)
+            with self.lock:
+                self.in_flight -= 1
+            dims = ("relevance", "novelty", "rigor", "impact", "clarity")
+            return json.dumps({key: {"score": 4, "rationale": ""} for key in dims})
+
+        def describe_task_provider(self, task_type="default"):
+            return {"provider_name": "fake", "model_name": "judge-model", "cost_tier": 1}
+
+    report = {
+        "queries": [
+            {
+                "normalized_query": f"q{q}",
+                "top_items": [{"title": f"p{q}-{i}", "score": 1.0} for i in range(3)],
+            }
+            for q in range(4)
+        ]
+    }
+    llm = _TrackingLLM()
+
+    judged = apply_judge_scores_to_report(
+        report, llm_service=llm, max_items_per_query=3, n_runs=3, max_workers=2
+    )
+
+    assert llm.calls == 4 * 3 * 3
+    assert llm.peak <= 2
+    assert all("judge" in item for q in judged["queries"] for item in q["top_items"])
+
+    # A single query hands the whole worker budget to the judge's own pool.
+    llm = _TrackingLLM()
+    apply_judge_scores_to_report(
+        {"queries": report["queries"][:1]},
+        llm_service=llm,
+        max_items_per_query=3,
+        n_runs=3,
+        max_workers=4,
+    )
+
+    assert llm.calls == 3 * 3
+    assert 1 < llm.peak <= 4
+
+
+def test_enrich_daily_report_summarizes_duplicate_papers_once():
+    class _CountingLLMService(_FakeLLMService):
+        def __init__(self):
+            self.summary_calls = 0
+
+        def summarize_paper(self, title: str, abstract: str) -> str:
+            self.summary_calls += 1
+            return super().summarize_paper(title, abstract)
+
+    search_result = _sample_search_result()
+    search_result["queries"].append(dict(search_result["queries"][0], normalized_query="icl"))
+    report = build_daily_paper_report(search_result=search_result, title="Dup", top_n=5)
+
+    svc = _CountingLLMService()
+    enriched = enrich_daily_paper_report(report, llm_service=svc, llm_features=["summary"])
+
+    assert svc.summary_calls == 1
+    assert [q["top_items"][0]["ai_summary"] for q in enriched["queries"]] == [
+        "summary:UniICL",
+        "summary:UniICL",
+    ]
+
+
+def test_enrich_daily_report_does_not_mutate_input_report():
+    report = build_daily_paper_report(
+        search_result=_sample_search_result(), title="My Daily", top_n=5
+    )
+    enriched = enrich_daily_paper_report(
+        report, llm_service=_FakeLLMService(), llm_features=["summary", "relevance"]
+    )
+
+    assert "ai_summary" in enriched["queries"][0]["top_items"][0]
+    assert "ai_summary" not in report["queries"][0]["top_items"][0]
+    assert "relevance" not in report["queries"][0]["top_items"][0]
+    assert "llm_analysis" not in report
+
+
+def test_reporter_write_many_writes_each_report(tmp_path):
+    reporter = DailyPaperReporter(output_dir=str(tmp_path / "daily"))
+    report_a = build_daily_paper_report(search_result=_sample_search_result(), title="A")
+    report_b = dict(report_a, title="B", date="2020-01-01")
+
+    artifacts = reporter.write_many(
+        [
+            (report_a, "# A", ["markdown"], None),
+            (report_b, "# B", ["markdown", "json"], "b-slug"),
+        ]
+    )
+
+    assert artifacts[0].json_path is None
+    assert (tmp_path / "daily" / "2020-01-01-b-slug.md").read_text(encoding="utf-8") == "# B"
+    assert artifacts[1].json_path.endswith("2020-01-01-b-slug.json")
+    assert reporter.write_many([]) == []
+
+
+def test_enrich_daily_report_falls_back_when_a_call_fails():
+    class _FlakyLLMService(_FakeLLMService):
+        def assess_relevance(self, *, paper, query: str):
+            raise RuntimeError("provider down")
+
+    report = build_daily_paper_report(
+        search_result=_sample_search_result(), title="My Daily", top_n=5
+    )
+    enriched = enrich_daily_paper_report(
+        report,
+        llm_service=_FlakyLLMService(),
+        llm_features=["summary", "relevance", "insight"],
+    )
+    top_item = enriched["queries"][0]["top_items"][0]
+
+    assert top_item["ai_summary"] == "summary:UniICL"
+    # Token-overlap heuristic: "icl" hits the title, "compression" misses.
+    assert top_item["relevance"] == {
+        "score": 50,
+        "reason": "Fallback score from token overlap (LLM output unavailable).",
+    }
+    assert enriched["llm_analysis"]["daily_insight"] == "daily insight"
+
+
+def test_enrich_daily_report_propagates_failures_when_service_raises():
+    import pytest
+
+    class _StrictLLMService(_FakeLLMService):
+        raise_errors = True
+
+        def assess_relevance(self, *, paper, query: str):
+            raise RuntimeError("provider down")
+
+    report = build_daily_paper_report(
+        search_result=_sample_search_result(), title="My Daily", top_n=5
+    )
+    with pytest.raises(RuntimeError, match="provider down"):
+        enrich_daily_paper_report(
+            report,
+            llm_service=_StrictLLMService(),
+            llm_features=["summary", "relevance", "insight"],
+        )
+
+
+def test_apply_judge_scores_does_not_mutate_input_report(monkeypatch):
+    report = build_daily_paper_report(
+        search_result=_sample_search_result(), title="Judge Daily", top_n=5
+    )
+
+    class _FakeJudgment:
+        def to_dict(self):
+            return {"overall": 3.0, "recommendation": "skim"}
+
+    class _FakeJudge:
+        def __init__(self, llm_service=None, max_workers=1):
+            pass
+
+        def judge_batch(self, *, papers, query, n_runs=1):
+            return [_FakeJudgment() for _ in papers]
+
+    import paperbot.application.workflows.dailypaper as daily_mod
+
+    monkeypatch.setattr(daily_mod, "PaperJudge", _FakeJudge)
+
+    judged = apply_judge_scores_to_report(report, max_items_per_query=3, n_runs=1)
+
+    assert judged["queries"][0]["top_items"][0]["judge"]["overall"] == 3.0
+    assert "judge" not in report["queries"][0]["top_items"][0]
+    assert "judge" not in report
+
+
+def test_compose_daily_report_matches_chained_stages(monkeypatch):
+    class _FakeJudgment:
+        def to_dict(self):
+            return {"overall": 3.0, "recommendation": "skim"}
+
+    class _FakeJudge:
+        def __init__(self, llm_service=None, max_workers=1):
+            pass
+
+        def judge_batch(self, *, papers, query, n_runs=1):
+            return [_FakeJudgment() for _ in papers]
+
+    import paperbot.application.workflows.dailypaper as daily_mod
+
+    monkeypatch.setattr(daily_mod, "PaperJudge", _FakeJudge)
+
+    search_result = _sample_search_result()
+    chained = apply_judge_scores_to_report(
+        enrich_daily_paper_report(
+            build_daily_paper_report(search_result=search_result, title="Compose", top_n=5),
+            llm_service=_FakeLLMService(),
+            llm_features=["summary", "relevance"],
+        ),
+        max_items_per_query=3,
+    )
+    composed = compose_daily_report(
+        search_result=search_result,
+        title="Compose",
+        top_n=5,
+        llm_service=_FakeLLMService(),
+        llm_features=["summary", "relevance"],
+        enable_judge=True,
+        judge_max_items_per_query=3,
+    )
+
+    for key in ("queries", "global_top", "llm_analysis", "judge"):
+        assert composed[key] == chained[key]
+    assert "ai_summary" not in search_result["queries"][0]["items"][0]
+
+
+def test_compose_daily_report_passes_stage_knobs_through(monkeypatch):
+    import paperbot.application.workflows.dailypaper as daily_mod
+
+    seen = {}
+    monkeypatch.setattr(
+        daily_mod, "_enrich_report_in_place", lambda report, **kwargs: seen.update(enrich=kwargs)
+    )
+    monkeypatch.setattr(
+        daily_mod, "_judge_report_in_place", lambda report, **kwargs: seen.update(judge=kwargs)
+    )
+
+    compose_daily_report(
+        search_result=_sample_search_result(),
+        llm_features=["summary"],
+        llm_max_items_per_query=7,
+        llm_max_workers=2,
+        enable_judge=True,
+        judge_max_workers=1,
+    )
+
+    assert seen["enrich"]["max_items_per_query"] == 7
+    assert seen["enrich"]["max_workers"] == 2
+    assert seen["judge"]["max_workers"] == 1
+
+
+def test_clone_report_spine_isolates_query_items_and_deepcopy_stays_deep():
+    import copy
+
+    import paperbot.application.workflows.dailypaper as daily_mod
+
+    report = build_daily_paper_report(search_result=_sample_search_result(), title="Copy")
+    cloned = daily_mod._clone_report_spine(report)
+    cloned["queries"][0]["top_items"][0]["ai_summary"] = "changed"
+    cloned["queries"][0]["top_items"].append({"title": "extra"})
+
+    assert "ai_summary" not in report["queries"][0]["top_items"][0]
+    assert len(report["queries"][0]["top_items"]) == 1
+
+    # copy.deepcopy (e.g. background enrichment snapshots) must not share nested state.
+    snapshot = copy.deepcopy(report)
+    snapshot["global_top"][0]["matched_queries"].append("other")
+    assert report["global_top"][0]["matched_queries"] == ["icl compression"]
+
+
+def test_select_judge_candidates_numpy_ranking_matches_sorted(monkeypatch):
+    import pytest
+
+    pytest.importorskip("numpy")
+    import paperbot.application.workflows.dailypaper as daily_mod
+
+    scores = [3.0, 7.5, 3.0, 1.0, 7.5, 0.0]
+    report = {
+        "queries": [
+            {"top_items": [{"title": f"p{idx}", "score": score} for idx, score in enumerate(scores)]}
+        ]
+    }
+    # token_budget=0 routes through _rank_judge_candidates (budgets use the heap).
+    expected = daily_mod.select_judge_candidates(report, max_items_per_query=10, token_budget=0)
+
+    argsort_calls = []
+    real_argsort = daily_mod.np.argsort
+
+    def _tracking_argsort(*args, **kwargs):
+        argsort_calls.append(kwargs.get("kind"))
+        return real_argsort(*args, **kwargs)
+
+    monkeypatch.setattr(daily_mod, "_NUMPY_RANK_MIN_CANDIDATES", 1)
+    monkeypatch.setattr(daily_mod.np, "argsort", _tracking_argsort)
+    actual = daily_mod.select_judge_candidates(report, max_items_per_query=10, token_budget=0)
+
+    assert argsort_calls == ["stable"]
+    assert actual == expected
+    assert [row["item_index"] for row in actual["selected"]] == [1, 4, 0, 2, 3, 5]
+
+    # The budgeted heap path ranks in the same order.
+    budgeted = daily_mod.select_judge_candidates(report, max_items_per_query=10, token_budget=3000)
+    assert [row["item_index"] for row in budgeted["selected"]] == [1, 4]
+
+
+def test_reporter_write_keeps_previous_file_when_write_fails(tmp_path, monkeypatch):
+    import pytest
+
+    import paperbot.application.workflows.dailypaper as daily_mod
+
+    reporter = DailyPaperReporter(output_dir=str(tmp_path))
+    report = {"title": "Atomic", "date": "2025-01-01"}
+    first = reporter.write(report=report, markdown="# v1", formats=["markdown"])
+
+    def _explode(path, markdown):
+        path.write_text("partial", encoding="utf-8")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(daily_mod, "_write_markdown", _explode)
+    with pytest.raises(OSError):
+        reporter.write(report=report, markdown="# v2", formats=["markdown"])
+
+    assert open(first.markdown_path, encoding="utf-8").read() == "# v1"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["2025-01-01-atomic.md"]
+
+
+def test_reporter_json_matches_stdlib_with_and_without_orjson(tmp_path, monkeypatch):
+    import json
+
+    import paperbot.application.workflows.dailypaper as daily_mod
+
+    report = build_daily_paper_report(search_result=_sample_search_result(), title="压缩 Daily")
+    expected = json.dumps(report, ensure_ascii=False, indent=2)
+    reporter = DailyPaperReporter(output_dir=str(tmp_path))
+
+    first = reporter.write(report=report, markdown="", formats=["json"], slug="a")
+    monkeypatch.setattr(daily_mod, "orjson", None)
+    second = reporter.write(report=report, markdown="", formats=["json"], slug="b")
+
+    for artifacts in (first, second):
+        with open(artifacts.json_path, encoding="utf-8") as fh:
+            assert fh.read() == expected
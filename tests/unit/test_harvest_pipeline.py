@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+import pytest
+
+from paperbot.application.services.paper_search_service import SearchResult
+from paperbot.application.workflows.harvest_pipeline import (
+    HarvestConfig,
+    HarvestFinalResult,
+    HarvestPipeline,
+    HarvestProgress,
+)
+from paperbot.domain.paper import PaperCandidate
+
+
+class _FakeSearchService:
+    def __init__(self, result: Optional[SearchResult] = None, error: Optional[Exception] = None):
+        self.result = result or SearchResult()
+        self.error = error
+        self.queries: List[str] = []
+        self.closed = False
+
+    async def search(self, query: str, **kwargs) -> SearchResult:
+        self.queries.append(query)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _search_result() -> SearchResult:
+    shared = PaperCandidate(title="Shared Paper")
+    arxiv_only = PaperCandidate(title="Arxiv Only")
+    return SearchResult(
+        papers=[shared, arxiv_only],
+        provenance={
+            shared.title_hash: ["arxiv", "openalex"],
+            arxiv_only.title_hash: ["arxiv"],
+        },
+        total_raw=3,
+        duplicates_removed=1,
+    )
+
+
+def _config(**overrides) -> HarvestConfig:
+    values = dict(keywords=["transformer"], expand_keywords=False, recommend_venues=False)
+    values.update(overrides)
+    return HarvestConfig(**values)
+
+
+@pytest.mark.asyncio
+async def test_run_records_search_outcome(tmp_path):
+    search = _FakeSearchService(_search_result())
+    pipeline = HarvestPipeline(db_url=f"sqlite:///{tmp_path / 'h.db'}", search_service=search)
+
+    items = [item async for item in pipeline.run(_config(), run_id="run-1")]
+    final = items[-1]
+
+    assert isinstance(final, HarvestFinalResult)
+    assert all(isinstance(item, HarvestProgress) for item in items[:-1])
+    assert [item.phase for item in items[:-1]] == ["Expanding", "Initializing", "Harvesting"]
+    assert final.status == "success"
+    assert (final.papers_found, final.papers_new, final.papers_deduplicated) == (3, 2, 1)
+    assert final.source_results["arxiv"]["papers"] == 2
+    assert final.source_results["openalex"]["papers"] == 1
+    assert final.source_results["semantic_scholar"]["papers"] == 0
+
+    run = pipeline.paper_store.get_harvest_run("run-1")
+    assert run.status == "success"
+    assert run.papers_found == 3
+    await pipeline.close()
+
+
+@pytest.mark.asyncio
+async def test_run_marks_failed_when_search_raises(tmp_path):
+    search = _FakeSearchService(error=RuntimeError("boom"))
+    pipeline = HarvestPipeline(db_url=f"sqlite:///{tmp_path / 'h.db'}", search_service=search)
+
+    final = await pipeline.run_sync(_config(), run_id="run-2")
+
+    assert final.status == "failed"
+    assert final.errors == {"search_service": "boom"}
+    assert pipeline.paper_store.get_harvest_run("run-2").status == "failed"
+    await pipeline.close()
+
+
+@pytest.mark.asyncio
+async def test_run_record_exists_before_search_starts(tmp_path):
+    seen_rows = []
+
+    class _CheckingSearchService(_FakeSearchService):
+        async def search(self, query: str, **kwargs) -> SearchResult:
+            seen_rows.append(pipeline.paper_store.get_harvest_run("run-3"))
+            return await super().search(query, **kwargs)
+
+    pipeline = HarvestPipeline(
+        db_url=f"sqlite:///{tmp_path / 'h.db'}",
+        search_service=_CheckingSearchService(_search_result()),
+    )
+
+    final = await pipeline.run_sync(_config(), run_id="run-3")
+
+    assert final.status == "success"
+    assert seen_rows and seen_rows[0] is not None
+    await pipeline.close()
+
+
+class _CountingRewriter:
+    def __init__(self):
+        self.calls = 0
+
+    def expand_all(self, keywords):
+        self.calls += 1
+        return [*keywords, "expanded"]
+
+
+@pytest.mark.asyncio
+async def test_run_reuses_keyword_expansion_across_runs(tmp_path):
+    search = _FakeSearchService(_search_result())
+    pipeline = HarvestPipeline(db_url=f"sqlite:///{tmp_path / 'h.db'}", search_service=search)
+    rewriter = pipeline._query_rewriter = _CountingRewriter()
+
+    await pipeline.run_sync(_config(expand_keywords=True))
+    await pipeline.run_sync(_config(expand_keywords=True))
+
+    assert rewriter.calls == 1
+    assert search.queries == ["transformer expanded", "transformer expanded"]
+    await pipeline.close()
+
+
+@pytest.mark.asyncio
+async def test_run_reports_unknown_sources_without_searching_them(tmp_path):
+    search = _FakeSearchService(_search_result())
+    pipeline = HarvestPipeline(db_url=f"sqlite:///{tmp_path / 'h.db'}", search_service=search)
+
+    partial = await pipeline.run_sync(_config(sources=["arxiv", "nope"]))
+    assert partial.status == "partial"
+    assert partial.errors == {"nope": "Unknown source: nope"}
+    assert list(partial.source_results) == ["arxiv"]
+
+    failed = await pipeline.run_sync(_config(sources=["nope"]))
+    assert failed.status == "failed"
+    assert len(search.queries) == 1
+    await pipeline.close()
+
+
+@pytest.mark.asyncio
+async def test_run_fails_fast_without_keywords(tmp_path):
+    search = _FakeSearchService(_search_result())
+    pipeline = HarvestPipeline(db_url=f"sqlite:///{tmp_path / 'h.db'}", search_service=search)
+
+    result = await pipeline.run_sync(_config(keywords=[" "]), run_id="empty")
+
+    assert result.status == "failed"
+    assert result.errors == {"config": "no keywords"}
+    assert search.queries == []
+    # The fail-fast path never opens the store.
+    assert pipeline._paper_store is None
+    assert pipeline.paper_store.get_harvest_run("empty") is None
+    await pipeline.close()
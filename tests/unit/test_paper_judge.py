@@ -110,9 +110,11 @@ def test_paper_judge_calibration_uses_median():
     class _SwitchingLLM:
         def __init__(self):
             self.calls = 0
+            self.use_cache = []
 
         def complete(self, **kwargs):
             self.calls += 1
+            self.use_cache.append(kwargs.get("use_cache", True))
             score = 3 if self.calls == 1 else (5 if self.calls == 2 else 4)
             payload = {
                 "relevance": {"score": score, "rationale": ""},
@@ -128,8 +130,137 @@ def test_paper_judge_calibration_uses_median():
         def describe_task_provider(self, task_type="default"):
             return {"provider_name": "fake", "model_name": "judge-model", "cost_tier": 1}
 
-    judge = PaperJudge(llm_service=_SwitchingLLM())
+    llm = _SwitchingLLM()
+    judge = PaperJudge(llm_service=llm)
     result = judge.judge_with_calibration(paper={"title": "x", "snippet": "y"}, query="icl", n_runs=3)
 
     assert result.relevance.score == 4
+    # Every calibration run is a real, uncached sample.
+    assert llm.use_cache == [False, False, False]
     assert result.recommendation in {"must_read", "worth_reading", "skim", "skip"}
+
+
+def test_paper_judge_batch_preserves_input_order_with_workers():
+    class _TitleEchoLLM:
+        def complete(self, **kwargs):
+            user = kwargs["user"]
+            score = 5 if "- Title: high" in user else 1
+            payload = {
+                key: {"score": score, "rationale": ""}
+                for key in ("relevance", "novelty", "rigor", "impact", "clarity")
+            }
+            return json.dumps(payload)
+
+        def describe_task_provider(self, task_type="default"):
+            return {"provider_name": "fake", "model_name": "judge-model", "cost_tier": 1}
+
+    judge = PaperJudge(llm_service=_TitleEchoLLM(), max_workers=4)
+    papers = [{"title": title, "snippet": ""} for title in ("high", "low", "high", "low", "low")]
+
+    results = judge.judge_batch(papers=papers, query="q")
+
+    assert [r.relevance.score for r in results] == [5, 1, 5, 1, 1]
+
+
+def test_paper_judge_batch_calibrates_each_paper_from_one_pool():
+    class _TitleEchoLLM:
+        def __init__(self):
+            self.use_cache = []
+
+        def complete(self, **kwargs):
+            self.use_cache.append(kwargs.get("use_cache", True))
+            score = 5 if "- Title: high" in kwargs["user"] else 1
+            payload = {
+                key: {"score": score, "rationale": ""}
+                for key in ("relevance", "novelty", "rigor", "impact", "clarity")
+            }
+            return json.dumps(payload)
+
+        def describe_task_provider(self, task_type="default"):
+            return {"provider_name": "fake", "model_name": "judge-model", "cost_tier": 1}
+
+    llm = _TitleEchoLLM()
+    judge = PaperJudge(llm_service=llm, max_workers=3)
+    papers = [{"title": title, "snippet": ""} for title in ("low", "high", "low")]
+
+    results = judge.judge_batch(papers=papers, query="q", n_runs=2)
+
+    assert [r.relevance.score for r in results] == [1, 5, 1]
+    assert llm.use_cache == [False] * 6
+
+
+def test_paper_judge_single_call_batch_scores_chunk_and_falls_back_on_missing_index():
+    class _BatchLLM:
+        def __init__(self):
+            self.prompts = []
+
+        def complete(self, **kwargs):
+            user = kwargs["user"]
+            self.prompts.append(user)
+            if "### Paper 0" in user:
+                dims = {
+                    key: {"score": 5, "rationale": ""}
+                    for key in ("relevance", "novelty", "rigor", "impact", "clarity")
+                }
+                # Only paper 0 is answered; paper 1 must be re-judged on its own.
+                return "Here you go:\n" + json.dumps([dict(dims, index=0)])
+            dims = {
+                key: {"score": 2, "rationale": ""}
+                for key in ("relevance", "novelty", "rigor", "impact", "clarity")
+            }
+            return json.dumps(dims)
+
+        def describe_task_provider(self, task_type="default"):
+            return {"provider_name": "fake", "model_name": "judge-model", "cost_tier": 1}
+
+    llm = _BatchLLM()
+    judge = PaperJudge(llm_service=llm)
+    results = judge.judge_single_call_batch(
+        papers=[{"title": "a"}, {"title": "b"}], query="q", batch_size=5
+    )
+
+    assert [r.relevance.score for r in results] == [5, 2]
+    assert len(llm.prompts) == 2
+
+
+def test_paper_judge_parses_payload_wrapped_in_prose():
+    class _ChattyLLM(_FakeLLMService):
+        def complete(self, **kwargs):
+            return "Sure, here is the JSON:\n" + super().complete(**kwargs) + "\nLet me know!"
+
+    payload = {
+        "relevance": {"score": 2, "rationale": "weak"},
+        "novelty": {"score": 3, "rationale": ""},
+        "rigor": {"score": 3, "rationale": ""},
+        "impact": {"score": 3, "rationale": ""},
+        "clarity": {"score": 3, "rationale": ""},
+        "recommendation": "skip",
+    }
+    judge = PaperJudge(llm_service=_ChattyLLM(payload))
+    result = judge.judge_single(paper={"title": "x"}, query="q")
+
+    assert result.relevance.score == 2
+    assert result.recommendation == "skip"
+
+
+def test_paper_judge_calibration_even_runs_picks_observed_low_median():
+    class _AlternatingLLM:
+        def __init__(self):
+            self.calls = 0
+
+        def complete(self, **kwargs):
+            self.calls += 1
+            score = 3 if self.calls % 2 else 5
+            payload = {
+                key: {"score": score, "rationale": ""}
+                for key in ("relevance", "novelty", "rigor", "impact", "clarity")
+            }
+            return json.dumps(payload)
+
+        def describe_task_provider(self, task_type="default"):
+            return {"provider_name": "fake", "model_name": "judge-model", "cost_tier": 1}
+
+    judge = PaperJudge(llm_service=_AlternatingLLM())
+    result = judge.judge_with_calibration(paper={"title": "x"}, query="q", n_runs=2)
+
+    assert result.relevance.score == 3
@@ -98,6 +98,43 @@ async def test_persist_search_results_disables_author_sync_for_latency() -> None
     assert registry.sync_flags == [False]
 
 
+class _FakeBatchRegistry(_FakeRegistry):
+    def __init__(self, *, fail_batch: bool = False):
+        self.sync_flags = []
+        self.batches: list[list[str]] = []
+        self.fail_batch = fail_batch
+
+    def upsert_papers(self, *, papers) -> list:
+        self.batches.append([hint for _, hint in papers])
+        if self.fail_batch:
+            raise RuntimeError("database is locked")
+        return [{"id": index + 10} for index, _ in enumerate(papers)]
+
+
+@pytest.mark.asyncio
+async def test_persist_search_results_uses_one_batch_and_falls_back_per_paper() -> None:
+    adapters = {
+        "semantic_scholar": _FakeAdapter(
+            "semantic_scholar", [PaperCandidate(title="P1"), PaperCandidate(title="P2")]
+        )
+    }
+    batched = _FakeBatchRegistry()
+    result = await PaperSearchService(adapters=adapters, registry=batched).search(
+        "p", sources=["semantic_scholar"], persist=True
+    )
+
+    assert batched.batches == [["semantic_scholar", "semantic_scholar"]]
+    assert batched.sync_flags == []
+    assert [paper.canonical_id for paper in result.papers] == [10, 11]
+
+    failing = _FakeBatchRegistry(fail_batch=True)
+    await PaperSearchService(adapters=adapters, registry=failing).search(
+        "p", sources=["semantic_scholar"], persist=True
+    )
+
+    assert failing.sync_flags == [False, False]
+
+
 @pytest.mark.asyncio
 async def test_rrf_dedup_prefers_shared_arxiv_identity_over_title_hash() -> None:
     from_s2 = PaperCandidate(
@@ -126,3 +163,25 @@ async def test_rrf_dedup_prefers_shared_arxiv_identity_over_title_hash() -> None
     assert result.duplicates_removed == 1
     assert len(result.papers) == 1
     assert set(result.papers[0].retrieval_sources) == {"semantic_scholar", "hf_daily"}
+
+
+@pytest.mark.asyncio
+async def test_close_closes_every_adapter_even_when_one_fails() -> None:
+    closed: list[str] = []
+
+    class _ClosingAdapter(_FakeAdapter):
+        async def close(self) -> None:
+            if self.source_name == "arxiv":
+                raise RuntimeError("already closed")
+            closed.append(self.source_name)
+
+    service = PaperSearchService(
+        adapters={
+            "arxiv": _ClosingAdapter("arxiv", []),
+            "openalex": _ClosingAdapter("openalex", []),
+        }
+    )
+
+    await service.close()
+
+    assert closed == ["openalex"]
@@ -75,3 +75,21 @@ def test_ingest_daily_report_to_registry_is_idempotent(tmp_path: Path):
     assert rows[0]["arxiv_id"] == "2501.12345"
     assert rows[0]["title"] == "UniICL"
     assert rows[0]["authors"] == ["A", "B"]
+
+
+def test_upsert_papers_persists_batch_in_one_transaction(tmp_path: Path):
+    store = SqlAlchemyPaperStore(db_url=f"sqlite:///{tmp_path / 'batch.db'}")
+    paper = {"title": "UniICL", "url": "https://arxiv.org/abs/2501.12345", "authors": ["A"]}
+
+    results = store.upsert_papers(
+        papers=[(paper, "arxiv"), (dict(paper, citation_count=7), "papers_cool")]
+    )
+
+    # The second entry matches the row created earlier in the same batch.
+    assert [r["_created"] for r in results] == [True, False]
+    assert results[0]["id"] == results[1]["id"]
+    rows = store.list_recent(limit=5)
+    assert len(rows) == 1
+    assert rows[0]["sources"] == ["arxiv", "papers_cool"]
+    assert rows[0]["citation_count"] == 7
+    store.close()
@@ -0,0 +1,40 @@
+from paperbot.application.workflows.analysis.paper_summarizer import PaperSummarizer
+
+
+class _CountingLLMService:
+    def __init__(self):
+        self.titles = []
+
+    def summarize_paper(self, *, title, abstract):
+        self.titles.append(title)
+        return f"summary of {title}"
+
+
+def test_paper_summarizer_cache_evicts_least_recently_used():
+    llm = _CountingLLMService()
+    summarizer = PaperSummarizer(llm_service=llm, max_cache_size=2)
+
+    summarizer.summarize_item({"title": "a"})
+    summarizer.summarize_item({"title": "b"})
+    summarizer.summarize_item({"title": "A "})  # hit: "a" becomes most recent
+    summarizer.summarize_item({"title": "c"})  # evicts "b"
+    summarizer.summarize_item({"title": "a"})
+    summarizer.summarize_item({"title": "b"})
+
+    assert llm.titles == ["a", "b", "c", "b"]
+    assert len(summarizer._cache) == 2
+
+
+def test_paper_summarizer_does_not_cache_failed_summary():
+    class _FlakyLLMService(_CountingLLMService):
+        def summarize_paper(self, *, title, abstract):
+            self.titles.append(title)
+            return "" if len(self.titles) == 1 else f"summary of {title}"
+
+    llm = _FlakyLLMService()
+    summarizer = PaperSummarizer(llm_service=llm)
+
+    assert summarizer.summarize_item({"title": "a"}) == ""
+    assert summarizer.summarize_item({"title": "a"}) == "summary of a"
+    assert summarizer.summarize_item({"title": "a"}) == "summary of a"
+    assert llm.titles == ["a", "a"]
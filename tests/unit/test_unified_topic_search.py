@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import Dict, List
+
+import pytest
+
+from paperbot.application.services.paper_search_service import SearchResult
+from paperbot.application.workflows import unified_topic_search as uts
+from paperbot.domain.paper import PaperCandidate
+
+
+class _FakeSearchService:
+    def __init__(self, results: Dict[str, SearchResult]):
+        self.results = results
+        self.queries: List[str] = []
+
+    async def search(self, query: str, **kwargs) -> SearchResult:
+        self.queries.append(query)
+        return self.results.get(query, SearchResult())
+
+
+def test_query_helpers_normalize_and_cache():
+    assert uts._normalize_query("  ICL   压缩 ") == "icl compression"
+    assert uts._normalize_query("Sparse  Attention") == "sparse attention"
+    assert uts._tokenize_query("kv cache kv") == ("kv", "cache")
+
+    hits = uts._tokenize_query.cache_info().hits
+    uts._tokenize_query("kv cache kv")
+    assert uts._tokenize_query.cache_info().hits == hits + 1
+
+
+def test_normalize_topic_sources_returns_fresh_lists():
+    first = uts.normalize_topic_sources(["S2", " arxiv", "bogus", "s2"])
+    assert first == ["semantic_scholar", "arxiv"]
+    first.append("mutated")
+    assert uts.normalize_topic_sources(["S2", " arxiv", "bogus", "s2"]) == [
+        "semantic_scholar",
+        "arxiv",
+    ]
+    assert uts.normalize_topic_sources(None) == ["papers_cool"]
+    assert uts.normalize_topic_sources(["unknown"]) == ["papers_cool"]
+
+
+@pytest.mark.asyncio
+async def test_run_merges_duplicate_papers_across_queries():
+    shared = PaperCandidate(
+        title="KV Cache Acceleration",
+        abstract="icl compression for kv cache",
+        url="https://example.com/kv",
+        year=2024,
+    )
+    other = PaperCandidate(title="ICL Compression", url="https://example.com/icl", year=2020)
+    service = _FakeSearchService(
+        {
+            "kv cache": SearchResult(papers=[shared], provenance={shared.title_hash: ["arxiv"]}),
+            "icl compression": SearchResult(
+                papers=[other, shared],
+                provenance={other.title_hash: ["papers_cool"], shared.title_hash: ["papers_cool"]},
+            ),
+        }
+    )
+
+    result = await uts.run_unified_topic_search(
+        queries=["KV  cache", "icl压缩", "kv cache"],
+        sources=["papers_cool", "arxiv"],
+        search_service=service,
+    )
+
+    assert service.queries == ["kv cache", "icl compression"]
+    assert [q["tokens"] for q in result["queries"]] == [["kv", "cache"], ["icl", "compression"]]
+    assert result["summary"]["unique_items"] == 2
+
+    merged = next(item for item in result["items"] if item["title"] == "KV Cache Acceleration")
+    assert merged["matched_queries"] == ["kv cache", "icl compression"]
+    assert merged["sources"] == ["arxiv", "papers_cool"]
+    assert result["summary"]["source_breakdown"] == {"arxiv": 1, "papers_cool": 2}
+    # Merging into the aggregate must not leak into the per-query views.
+    kv_view = result["queries"][0]["items"][0]
+    assert kv_view["matched_queries"] == ["kv cache"]
+    assert kv_view["sources"] == ["arxiv"]
+
+
+@pytest.mark.asyncio
+async def test_run_min_score_drops_papers_that_cannot_reach_it():
+    hit = PaperCandidate(title="Sparse Attention", url="https://example.com/hit", year=2020)
+    miss = PaperCandidate(title="Unrelated", url="https://example.com/miss", citation_count=10**6)
+    service = _FakeSearchService(
+        {"sparse attention": SearchResult(papers=[miss, hit])}
+    )
+
+    result = await uts.run_unified_topic_search(
+        queries=["sparse attention"], min_score=2.3, search_service=service
+    )
+
+    assert [item["title"] for item in result["items"]] == ["Sparse Attention"]